@@ -0,0 +1,36 @@
+"""Add covering index for Pipedrive person sync lookups
+
+Revision ID: add_pipedrive_covering_index
+Revises: add_typed_setting_value_columns
+Create Date: 2026-08-29 12:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_pipedrive_covering_index'
+down_revision = 'add_typed_setting_value_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The INCLUDE columns are everything the sync worker selects when
+    # resolving a plaintiff by Pipedrive person ID, so those lookups
+    # become index-only scans with zero heap fetches per hit.
+    op.execute("DROP INDEX IF EXISTS ix_plaintiffs_pipedrive_person_id")
+    op.execute(
+        "CREATE UNIQUE INDEX idx_plaintiffs_pipedrive_person_covering "
+        "ON plaintiffs (pipedrive_person_id) "
+        "INCLUDE (id, first_name, last_name, email, case_status)"
+    )
+
+
+def downgrade():
+    op.drop_index('idx_plaintiffs_pipedrive_person_covering', table_name='plaintiffs')
+    op.create_index(
+        'ix_plaintiffs_pipedrive_person_id',
+        'plaintiffs',
+        ['pipedrive_person_id'],
+        unique=True,
+    )
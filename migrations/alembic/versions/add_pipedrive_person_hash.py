@@ -0,0 +1,29 @@
+"""Add content-hash column for Pipedrive person sync short-circuit
+
+Revision ID: add_pipedrive_person_hash
+Revises: add_plaintiff_ssn_hmac
+Create Date: 2026-08-29 17:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_pipedrive_person_hash'
+down_revision = 'add_plaintiff_ssn_hmac'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Hash of the last person payload pushed to Pipedrive: re-syncs over
+    # unchanged data compare hashes and skip the outbound update call.
+    # NULL means "never synced / unknown", which always re-sends.
+    op.add_column(
+        'plaintiffs',
+        sa.Column('pipedrive_person_hash', sa.String(16), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column('plaintiffs', 'pipedrive_person_hash')
@@ -0,0 +1,33 @@
+"""Add indexed HMAC digest column for SSN lookups
+
+Revision ID: add_plaintiff_ssn_hmac
+Revises: prune_redundant_plaintiff_indexes
+Create Date: 2026-08-29 14:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'add_plaintiff_ssn_hmac'
+down_revision = 'prune_redundant_plaintiff_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Deterministic HMAC-SHA256 of the SSN: exact-match lookups probe
+    # this B-tree instead of decrypting/scanning every row. Existing rows
+    # are backfilled by application code that holds the HMAC key.
+    op.add_column(
+        'plaintiffs',
+        sa.Column('ssn_hmac', sa.LargeBinary(32), nullable=True),
+    )
+    op.create_index(
+        'ix_plaintiffs_ssn_hmac', 'plaintiffs', ['ssn_hmac'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_plaintiffs_ssn_hmac', table_name='plaintiffs')
+    op.drop_column('plaintiffs', 'ssn_hmac')
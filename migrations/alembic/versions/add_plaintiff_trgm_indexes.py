@@ -0,0 +1,33 @@
+"""Add pg_trgm GIN indexes for plaintiff name/email search
+
+Revision ID: add_plaintiff_trgm_indexes
+Revises: add_settings_tables
+Create Date: 2026-08-29 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_plaintiff_trgm_indexes'
+down_revision = 'add_settings_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # pg_trgm is required for trigram GIN indexes; ILIKE '%term%' searches
+    # on name/email cannot use the existing B-tree indexes.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX idx_plaintiffs_fullname_trgm ON plaintiffs "
+        "USING GIN (lower(first_name || ' ' || last_name) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_plaintiffs_email_trgm ON plaintiffs "
+        "USING GIN (lower(email) gin_trgm_ops)"
+    )
+
+
+def downgrade():
+    op.drop_index('idx_plaintiffs_email_trgm', table_name='plaintiffs')
+    op.drop_index('idx_plaintiffs_fullname_trgm', table_name='plaintiffs')
@@ -0,0 +1,66 @@
+"""Add typed value columns to settings and agent_settings
+
+Revision ID: add_typed_setting_value_columns
+Revises: partial_index_active_settings
+Create Date: 2026-08-29 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'add_typed_setting_value_columns'
+down_revision = 'partial_index_active_settings'
+branch_labels = None
+depends_on = None
+
+TYPED_COLUMNS = ('value_text', 'value_int', 'value_float', 'value_bool', 'value_json')
+
+
+def _add_typed_columns(table):
+    op.add_column(table, sa.Column('value_text', sa.Text(), nullable=True))
+    op.add_column(table, sa.Column('value_int', sa.Integer(), nullable=True))
+    op.add_column(table, sa.Column('value_float', sa.Float(), nullable=True))
+    op.add_column(table, sa.Column('value_bool', sa.Boolean(), nullable=True))
+    op.add_column(table, sa.Column('value_json', postgresql.JSONB(), nullable=True))
+
+
+def _backfill(table, source_column):
+    # Populate exactly one typed column per row from the serialized text,
+    # so reads never have to re-parse data_type at the Python level.
+    op.execute(
+        f"UPDATE {table} SET value_text = {source_column} "
+        f"WHERE data_type NOT IN ('boolean', 'integer', 'float', 'json')"
+    )
+    op.execute(
+        f"UPDATE {table} SET value_int = {source_column}::integer "
+        f"WHERE data_type = 'integer' AND {source_column} ~ '^-?[0-9]+$'"
+    )
+    op.execute(
+        f"UPDATE {table} SET value_float = {source_column}::double precision "
+        f"WHERE data_type = 'float' AND {source_column} ~ '^-?[0-9.]+$'"
+    )
+    op.execute(
+        f"UPDATE {table} SET value_bool = lower({source_column}) IN ('true', '1', 'yes', 'on') "
+        f"WHERE data_type = 'boolean' AND {source_column} IS NOT NULL"
+    )
+    op.execute(
+        f"UPDATE {table} SET value_json = {source_column}::jsonb "
+        f"WHERE data_type = 'json' AND {source_column} IS NOT NULL"
+    )
+
+
+def upgrade():
+    _add_typed_columns('settings')
+    _backfill('settings', "coalesce(current_value, default_value)")
+
+    _add_typed_columns('agent_settings')
+    _backfill('agent_settings', 'setting_value')
+
+
+def downgrade():
+    for column in reversed(TYPED_COLUMNS):
+        op.drop_column('agent_settings', column)
+    for column in reversed(TYPED_COLUMNS):
+        op.drop_column('settings', column)
@@ -0,0 +1,39 @@
+"""Convert plaintiff date_of_birth/incident_date to native DATE
+
+Revision ID: convert_plaintiff_dates_to_date
+Revises: convert_plaintiff_json_to_jsonb
+Create Date: 2026-08-29 11:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'convert_plaintiff_dates_to_date'
+down_revision = 'convert_plaintiff_json_to_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The string columns already hold YYYY-MM-DD, so a USING cast is safe.
+    # DATE is 4 bytes vs. 10+ for the varchar and gives the planner real
+    # type information for range scans.
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN date_of_birth "
+        "TYPE date USING date_of_birth::date"
+    )
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN incident_date "
+        "TYPE date USING incident_date::date"
+    )
+
+
+def downgrade():
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN incident_date "
+        "TYPE varchar(10) USING to_char(incident_date, 'YYYY-MM-DD')"
+    )
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN date_of_birth "
+        "TYPE varchar(10) USING to_char(date_of_birth, 'YYYY-MM-DD')"
+    )
@@ -0,0 +1,54 @@
+"""Convert plaintiff JSON columns to JSONB and add GIN indexes
+
+Revision ID: convert_plaintiff_json_to_jsonb
+Revises: add_plaintiff_trgm_indexes
+Create Date: 2026-08-29 10:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'convert_plaintiff_json_to_jsonb'
+down_revision = 'add_plaintiff_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = ('tags', 'custom_fields', 'risk_factors', 'lead_source_details')
+
+
+def upgrade():
+    # json columns cannot be GIN-indexed; jsonb enables containment (@>),
+    # key-existence (?) and path operators with index support.
+    for column in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE plaintiffs ALTER COLUMN {column} "
+            f"TYPE jsonb USING {column}::jsonb"
+        )
+
+    # jsonb_path_ops is substantially smaller than the default jsonb_ops
+    # and faster for the @> containment queries used by tag filtering.
+    op.execute(
+        "CREATE INDEX idx_plaintiffs_tags_gin ON plaintiffs "
+        "USING GIN (tags jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_plaintiffs_risk_factors_gin ON plaintiffs "
+        "USING GIN (risk_factors jsonb_path_ops)"
+    )
+    # Single-key lookups in custom_fields go through an expression B-tree;
+    # queries must use ->> with the exact same expression to hit it.
+    op.execute(
+        "CREATE INDEX idx_plaintiffs_custom_status ON plaintiffs "
+        "((custom_fields->>'status'))"
+    )
+
+
+def downgrade():
+    op.drop_index('idx_plaintiffs_custom_status', table_name='plaintiffs')
+    op.drop_index('idx_plaintiffs_risk_factors_gin', table_name='plaintiffs')
+    op.drop_index('idx_plaintiffs_tags_gin', table_name='plaintiffs')
+    for column in reversed(JSON_COLUMNS):
+        op.execute(
+            f"ALTER TABLE plaintiffs ALTER COLUMN {column} "
+            f"TYPE json USING {column}::json"
+        )
@@ -0,0 +1,30 @@
+"""Replace full is_active index with a partial index on active settings
+
+Revision ID: partial_index_active_settings
+Revises: convert_plaintiff_dates_to_date
+Create Date: 2026-08-29 11:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'partial_index_active_settings'
+down_revision = 'convert_plaintiff_dates_to_date'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Queries filter WHERE is_active = true; a partial index over only the
+    # active rows is far smaller than indexing the boolean for every row
+    # and also covers (category_id, key) lookups on the active path.
+    op.drop_index('idx_settings_active', table_name='settings')
+    op.execute(
+        "CREATE INDEX idx_settings_active_true ON settings (category_id, key) "
+        "WHERE is_active = true"
+    )
+
+
+def downgrade():
+    op.drop_index('idx_settings_active_true', table_name='settings')
+    op.create_index('idx_settings_active', 'settings', ['is_active'], unique=False)
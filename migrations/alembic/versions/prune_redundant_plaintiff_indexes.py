@@ -0,0 +1,40 @@
+"""Drop redundant single-column plaintiff indexes
+
+Revision ID: prune_redundant_plaintiff_indexes
+Revises: server_defaults_for_plaintiff_flags
+Create Date: 2026-08-29 14:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'prune_redundant_plaintiff_indexes'
+down_revision = 'server_defaults_for_plaintiff_flags'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # first_name/last_name are served by the trigram full-name index and
+    # the location trio collapses into one leftmost-prefix composite,
+    # cutting per-write index maintenance on the plaintiffs table.
+    op.execute("DROP INDEX IF EXISTS ix_plaintiffs_first_name")
+    op.execute("DROP INDEX IF EXISTS ix_plaintiffs_last_name")
+    op.execute("DROP INDEX IF EXISTS ix_plaintiffs_city")
+    op.execute("DROP INDEX IF EXISTS ix_plaintiffs_state")
+    op.execute("DROP INDEX IF EXISTS ix_plaintiffs_zip_code")
+    op.create_index(
+        'idx_plaintiffs_location',
+        'plaintiffs',
+        ['state', 'city', 'zip_code'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('idx_plaintiffs_location', table_name='plaintiffs')
+    op.create_index('ix_plaintiffs_zip_code', 'plaintiffs', ['zip_code'], unique=False)
+    op.create_index('ix_plaintiffs_state', 'plaintiffs', ['state'], unique=False)
+    op.create_index('ix_plaintiffs_city', 'plaintiffs', ['city'], unique=False)
+    op.create_index('ix_plaintiffs_last_name', 'plaintiffs', ['last_name'], unique=False)
+    op.create_index('ix_plaintiffs_first_name', 'plaintiffs', ['first_name'], unique=False)
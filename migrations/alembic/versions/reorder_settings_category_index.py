@@ -0,0 +1,37 @@
+"""Reorder settings category index to match list-page sort
+
+Revision ID: reorder_settings_category_index
+Revises: add_pipedrive_covering_index
+Create Date: 2026-08-29 13:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'reorder_settings_category_index'
+down_revision = 'add_pipedrive_covering_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # (category_id, is_active, sort_order, key) matches the list-page
+    # query's filter + ORDER BY, so rows stream out of the index already
+    # sorted and the old (category_id, key) index becomes redundant.
+    op.drop_index('idx_settings_category_key', table_name='settings')
+    op.create_index(
+        'idx_settings_category_sort',
+        'settings',
+        ['category_id', 'is_active', 'sort_order', 'key'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('idx_settings_category_sort', table_name='settings')
+    op.create_index(
+        'idx_settings_category_key',
+        'settings',
+        ['category_id', 'key'],
+        unique=False,
+    )
@@ -0,0 +1,43 @@
+"""Move plaintiff country/boolean defaults into the database
+
+Revision ID: server_defaults_for_plaintiff_flags
+Revises: reorder_settings_category_index
+Create Date: 2026-08-29 13:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'server_defaults_for_plaintiff_flags'
+down_revision = 'reorder_settings_category_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Server-side defaults apply to every insert path, including raw SQL
+    # and bulk loads that bypass the ORM's Python-level defaults.
+    op.execute("UPDATE plaintiffs SET country = 'USA' WHERE country IS NULL")
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN country SET DEFAULT 'USA', "
+        "ALTER COLUMN country SET NOT NULL"
+    )
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN bank_account_verified SET DEFAULT false"
+    )
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN opt_in_marketing SET DEFAULT false"
+    )
+
+
+def downgrade():
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN opt_in_marketing DROP DEFAULT"
+    )
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN bank_account_verified DROP DEFAULT"
+    )
+    op.execute(
+        "ALTER TABLE plaintiffs ALTER COLUMN country DROP DEFAULT, "
+        "ALTER COLUMN country DROP NOT NULL"
+    )
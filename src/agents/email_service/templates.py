@@ -1,7 +1,6 @@
 """Email template management and rendering system."""
 
 import json
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -10,11 +9,11 @@ from jinja2 import Environment, FileSystemLoader, Template, TemplateError
 from ...config.settings import get_settings
 from ...services.ai.openai_client import OpenAIClient
 from ...utils.logging import get_logger
+from ...utils.text import NON_DIGITS
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-
 class EmailTemplateEngine:
     """
     Email template management and rendering engine.
@@ -488,7 +487,7 @@ class EmailTemplateEngine:
         """Format phone number."""
         try:
             # Remove non-digits
-            digits = re.sub(r'\D', '', str(value))
+            digits = str(value).translate(NON_DIGITS)
             
             if len(digits) == 10:
                 return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
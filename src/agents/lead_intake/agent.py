@@ -1,19 +1,19 @@
 """Lead Intake Coordinator Agent implementation."""
 
-import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 from ...models.database.plaintiff import Plaintiff, CaseType, CaseStatus
+from ...models.schemas.common import Address, ContactInfo, FinancialInfo
 from ...models.schemas.plaintiff import PlaintiffCreate
 from ...config.database import get_database_session
 from ..base.agent import BaseAgent, AgentTask, AgentResponse, AgentType
 from ..base.communication import agent_communication
+from ...utils.text import NON_DIGITS
 from .parsers import EmailLeadParser, FormLeadParser, GenericLeadParser
 from .validators import LeadDataValidator
 
-
 class LeadIntakeCoordinatorAgent(BaseAgent):
     """
     Lead Intake Coordinator Agent for processing new leads.
@@ -303,6 +303,9 @@ class LeadIntakeCoordinatorAgent(BaseAgent):
         )
         
         # Create database record
+        contact = plaintiff_data.contact or ContactInfo()
+        address = plaintiff_data.address or Address()
+        financial = plaintiff_data.financial or FinancialInfo()
         async with get_database_session() as session:
             # Convert Pydantic model to SQLAlchemy model
             plaintiff = Plaintiff(
@@ -310,20 +313,26 @@ class LeadIntakeCoordinatorAgent(BaseAgent):
                 last_name=plaintiff_data.last_name,
                 middle_name=plaintiff_data.middle_name,
                 email=plaintiff_data.email,
-                phone=plaintiff_data.phone,
-                secondary_phone=plaintiff_data.secondary_phone,
-                date_of_birth=plaintiff_data.date_of_birth,
-                address_line_1=plaintiff_data.address_line_1,
-                address_line_2=plaintiff_data.address_line_2,
-                city=plaintiff_data.city,
-                state=plaintiff_data.state,
-                zip_code=plaintiff_data.zip_code,
+                phone=contact.phone,
+                secondary_phone=contact.secondary_phone,
+                date_of_birth=(
+                    date.fromisoformat(plaintiff_data.date_of_birth)
+                    if plaintiff_data.date_of_birth else None
+                ),
+                address_line_1=address.address_line_1,
+                address_line_2=address.address_line_2,
+                city=address.city,
+                state=address.state,
+                zip_code=address.zip_code,
                 case_type=plaintiff_data.case_type,
                 case_description=plaintiff_data.case_description,
-                incident_date=plaintiff_data.incident_date,
+                incident_date=(
+                    date.fromisoformat(plaintiff_data.incident_date)
+                    if plaintiff_data.incident_date else None
+                ),
                 employment_status=plaintiff_data.employment_status,
-                monthly_income=plaintiff_data.monthly_income,
-                monthly_expenses=plaintiff_data.monthly_expenses,
+                monthly_income=financial.monthly_income,
+                monthly_expenses=financial.monthly_expenses,
                 lead_source=plaintiff_data.lead_source,
                 notes=plaintiff_data.notes,
                 lead_source_details=lead_data.get("lead_source_details", {}),
@@ -523,7 +532,7 @@ class LeadIntakeCoordinatorAgent(BaseAgent):
             str: Normalized phone number.
         """
         # Remove all non-digit characters
-        digits = re.sub(r'\D', '', phone)
+        digits = phone.translate(NON_DIGITS)
         
         # Handle US phone numbers
         if len(digits) == 10:
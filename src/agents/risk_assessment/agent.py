@@ -1,12 +1,13 @@
 """Risk Assessment Agent implementation."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from ...config.database import get_database_session
 from ...models.database import Plaintiff, Case, Document
@@ -177,6 +178,9 @@ class RiskAssessmentAgent(BaseAgent):
             stmt = (
                 select(Plaintiff)
                 .where(Plaintiff.id == plaintiff_uuid)
+                # case_description is deferred on the model but needed by
+                # the legal/medical scoring after the session closes.
+                .options(undefer(Plaintiff.case_description))
             )
             result = await session.execute(stmt)
             plaintiff = result.scalar_one_or_none()
@@ -406,7 +410,11 @@ class RiskAssessmentAgent(BaseAgent):
         incident_date = case_info.get("incident_date") or plaintiff.incident_date
         if incident_date:
             try:
-                incident_dt = datetime.strptime(incident_date, "%Y-%m-%d")
+                # plaintiff.incident_date is a native date; case_info may
+                # still carry an ISO string from the task payload.
+                if isinstance(incident_date, str):
+                    incident_date = date.fromisoformat(incident_date)
+                incident_dt = datetime.combine(incident_date, datetime.min.time())
                 days_since_incident = (datetime.now() - incident_dt).days
                 
                 if days_since_incident > 730:  # 2 years
@@ -1,7 +1,6 @@
 """SMS Service Agent implementation."""
 
 import asyncio
-import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
@@ -14,6 +13,7 @@ from ...config.settings import get_settings
 from ...models.database import Plaintiff, Communication
 from ...services.ai.openai_client import OpenAIClient
 from ...utils.logging import get_logger
+from ...utils.text import NON_DIGITS
 from ..base.agent import BaseAgent, AgentTask, AgentResponse
 from ..base.communication import agent_communication
 from .providers import SMSProvider, TwilioProvider
@@ -23,7 +23,6 @@ from .templates import SMSTemplateEngine
 logger = get_logger(__name__)
 settings = get_settings()
 
-
 class SMSServiceAgent(BaseAgent):
     """
     SMS Service Agent for automated SMS communication.
@@ -642,7 +641,7 @@ class SMSServiceAgent(BaseAgent):
             return None
         
         # Remove all non-digit characters
-        digits = re.sub(r'\D', '', phone)
+        digits = phone.translate(NON_DIGITS)
         
         # Handle different formats
         if len(digits) == 10:
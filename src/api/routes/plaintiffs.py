@@ -1,21 +1,73 @@
 """Plaintiff management API routes."""
 
-from typing import Optional
+from datetime import date
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Request, HTTPException
+
+import msgspec
+from fastapi import APIRouter, Request, HTTPException, Response
 from pydantic import BaseModel
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from ...config.database import get_database_session
-from ...models.database.plaintiff import Plaintiff, CaseType, CaseStatus, ContactMethod
+from ...models.database.plaintiff import (
+    Plaintiff,
+    CaseType,
+    CaseStatus,
+    ContactMethod,
+    _QUALIFIED_STATUSES,
+)
 from ...models.database.law_firm import LawFirm
+from ...models.schemas.common import decode_cursor, encode_cursor
+from ...models.schemas.plaintiff import PlaintiffStats
 from ...utils.logging import get_logger
 from ..middleware.auth import require_permissions
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+class PlaintiffListItem(msgspec.Struct, frozen=True):
+    """msgspec row for the list endpoint: validate+encode in one C pass
+    instead of per-field Pydantic validation and re-serialization."""
+
+    id: str
+    full_name: str
+    first_name: str
+    last_name: str
+    email: str
+    phone: Optional[str]
+    full_address: str
+    case_type: str
+    case_status: str
+    case_description: Optional[str]
+    incident_date: Optional[date]
+    law_firm_name: Optional[str]
+    employment_status: Optional[str]
+    monthly_income: Optional[float]
+    risk_score: Optional[float]
+    preferred_contact_method: str
+    lead_source: Optional[str]
+    created_at: str
+    updated_at: str
+
+
+class PlaintiffListPage(msgspec.Struct, frozen=True):
+    """Envelope for the paginated plaintiff list response.
+
+    total/page/pages are None when the page was fetched by cursor —
+    counting every matching row would defeat the keyset scan.
+    """
+
+    plaintiffs: List[PlaintiffListItem]
+    limit: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
 class PlaintiffCreate(BaseModel):
     first_name: str
     last_name: str
@@ -46,83 +98,141 @@ async def list_plaintiffs(
     request: Request,
     page: int = 1,
     limit: int = 20,
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     case_type: Optional[str] = None,
     search: Optional[str] = None
 ):
-    """List plaintiffs with pagination and filtering."""
+    """List plaintiffs with pagination and filtering.
+
+    Passing a cursor (from a previous response's next_cursor) switches to
+    keyset pagination: the scan starts at the cursor's (created_at, id)
+    position instead of walking and discarding `page * limit` rows, so
+    deep pages cost the same as the first one.
+    """
     try:
         async with get_database_session() as session:
-            stmt = select(Plaintiff).outerjoin(LawFirm)
-            
+            # Large text columns are deferred on the model; the list view
+            # only ships case_description, so undefer just that one.
+            stmt = (
+                select(Plaintiff)
+                .outerjoin(LawFirm)
+                .options(undefer(Plaintiff.case_description))
+            )
+
             # Apply filters
             if status:
                 stmt = stmt.where(Plaintiff.case_status == status)
             if case_type:
                 stmt = stmt.where(Plaintiff.case_type == case_type)
             if search:
-                search_term = f"%{search}%"
-                stmt = stmt.where(
-                    (Plaintiff.first_name.ilike(search_term)) |
-                    (Plaintiff.last_name.ilike(search_term)) |
-                    (Plaintiff.email.ilike(search_term))
+                # Match the lowered expressions of the pg_trgm GIN indexes
+                # (idx_plaintiffs_fullname_trgm / idx_plaintiffs_email_trgm)
+                # so the search hits an index scan instead of a seq scan.
+                search_term = f"%{search.lower()}%"
+                search_filter = (
+                    func.lower(
+                        Plaintiff.first_name + " " + Plaintiff.last_name
+                    ).like(search_term) |
+                    func.lower(Plaintiff.email).like(search_term)
                 )
-            
-            # Count total
-            count_stmt = select(func.count(Plaintiff.id))
-            if status:
-                count_stmt = count_stmt.where(Plaintiff.case_status == status)
-            if case_type:
-                count_stmt = count_stmt.where(Plaintiff.case_type == case_type)
-            if search:
-                search_term = f"%{search}%"
-                count_stmt = count_stmt.where(
-                    (Plaintiff.first_name.ilike(search_term)) |
-                    (Plaintiff.last_name.ilike(search_term)) |
-                    (Plaintiff.email.ilike(search_term))
-                )
-            
-            total_result = await session.execute(count_stmt)
-            total = total_result.scalar()
-            
+                stmt = stmt.where(search_filter)
+
+            total = None
+            if cursor is None:
+                # Count total (offset mode only)
+                count_stmt = select(func.count(Plaintiff.id))
+                if status:
+                    count_stmt = count_stmt.where(Plaintiff.case_status == status)
+                if case_type:
+                    count_stmt = count_stmt.where(Plaintiff.case_type == case_type)
+                if search:
+                    count_stmt = count_stmt.where(search_filter)
+
+                total_result = await session.execute(count_stmt)
+                total = total_result.scalar()
+
             # Apply pagination
-            stmt = stmt.offset((page - 1) * limit).limit(limit)
-            
+            stmt = stmt.order_by(Plaintiff.created_at.desc(), Plaintiff.id.desc())
+            if cursor is not None:
+                try:
+                    cursor_ts, cursor_id = decode_cursor(cursor)
+                except ValueError:
+                    raise HTTPException(
+                        status_code=400, detail="Invalid pagination cursor"
+                    )
+                # Keyset scan: fetch one extra row to detect another page.
+                stmt = stmt.where(
+                    tuple_(Plaintiff.created_at, Plaintiff.id)
+                    < (cursor_ts, cursor_id)
+                ).limit(limit + 1)
+            else:
+                # Offset mode fetches the same extra row so page-based
+                # responses can hand out a next_cursor and let clients
+                # switch to the keyset scan from any page.
+                stmt = stmt.offset((page - 1) * limit).limit(limit + 1)
+
             result = await session.execute(stmt)
             plaintiffs = result.scalars().all()
+
+            has_more = len(plaintiffs) > limit
+            if has_more:
+                plaintiffs = plaintiffs[:limit]
+
+            plaintiffs_data = [
+                PlaintiffListItem(
+                    id=str(plaintiff.id),
+                    full_name=plaintiff.full_name,
+                    first_name=plaintiff.first_name,
+                    last_name=plaintiff.last_name,
+                    email=plaintiff.email,
+                    phone=plaintiff.phone,
+                    full_address=plaintiff.full_address,
+                    case_type=plaintiff.case_type.value,
+                    case_status=plaintiff.case_status.value,
+                    case_description=plaintiff.case_description,
+                    incident_date=plaintiff.incident_date,
+                    law_firm_name=plaintiff.law_firm.name if plaintiff.law_firm else None,
+                    employment_status=plaintiff.employment_status,
+                    monthly_income=plaintiff.monthly_income,
+                    risk_score=plaintiff.risk_score,
+                    preferred_contact_method=plaintiff.preferred_contact_method.value,
+                    lead_source=plaintiff.lead_source,
+                    created_at=plaintiff.created_at.isoformat(),
+                    updated_at=plaintiff.updated_at.isoformat(),
+                )
+                for plaintiff in plaintiffs
+            ]
+
+            next_cursor = None
+            if has_more:
+                last = plaintiffs[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
+
+            if cursor is not None:
+                page_data = PlaintiffListPage(
+                    plaintiffs=plaintiffs_data,
+                    limit=limit,
+                    next_cursor=next_cursor,
+                )
+            else:
+                page_data = PlaintiffListPage(
+                    plaintiffs=plaintiffs_data,
+                    limit=limit,
+                    total=total,
+                    page=page,
+                    pages=(total + limit - 1) // limit,
+                    next_cursor=next_cursor,
+                )
+            # Encode once with msgspec and ship the bytes directly,
+            # skipping FastAPI's jsonable_encoder round-trip.
+            return Response(
+                content=msgspec.json.encode(page_data),
+                media_type="application/json",
+            )
             
-            plaintiffs_data = []
-            for plaintiff in plaintiffs:
-                plaintiffs_data.append({
-                    "id": str(plaintiff.id),
-                    "full_name": plaintiff.full_name,
-                    "first_name": plaintiff.first_name,
-                    "last_name": plaintiff.last_name,
-                    "email": plaintiff.email,
-                    "phone": plaintiff.phone,
-                    "full_address": plaintiff.full_address,
-                    "case_type": plaintiff.case_type.value,
-                    "case_status": plaintiff.case_status.value,
-                    "case_description": plaintiff.case_description,
-                    "incident_date": plaintiff.incident_date,
-                    "law_firm_name": plaintiff.law_firm.name if plaintiff.law_firm else None,
-                    "employment_status": plaintiff.employment_status,
-                    "monthly_income": plaintiff.monthly_income,
-                    "risk_score": plaintiff.risk_score,
-                    "preferred_contact_method": plaintiff.preferred_contact_method.value,
-                    "lead_source": plaintiff.lead_source,
-                    "created_at": plaintiff.created_at.isoformat(),
-                    "updated_at": plaintiff.updated_at.isoformat(),
-                })
-            
-            return {
-                "plaintiffs": plaintiffs_data,
-                "total": total,
-                "page": page,
-                "limit": limit,
-                "pages": (total + limit - 1) // limit
-            }
-            
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list plaintiffs: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve plaintiffs")
@@ -158,7 +268,10 @@ async def create_plaintiff(plaintiff_data: PlaintiffCreate, request: Request):
                 email=plaintiff_data.email,
                 phone=plaintiff_data.phone,
                 secondary_phone=plaintiff_data.secondary_phone,
-                date_of_birth=plaintiff_data.date_of_birth,
+                date_of_birth=(
+                    date.fromisoformat(plaintiff_data.date_of_birth)
+                    if plaintiff_data.date_of_birth else None
+                ),
                 address_line_1=plaintiff_data.address_line_1,
                 address_line_2=plaintiff_data.address_line_2,
                 city=plaintiff_data.city,
@@ -167,7 +280,10 @@ async def create_plaintiff(plaintiff_data: PlaintiffCreate, request: Request):
                 case_type=CaseType(plaintiff_data.case_type),
                 case_status=CaseStatus.INITIAL,
                 case_description=plaintiff_data.case_description,
-                incident_date=plaintiff_data.incident_date,
+                incident_date=(
+                    date.fromisoformat(plaintiff_data.incident_date)
+                    if plaintiff_data.incident_date else None
+                ),
                 law_firm_id=plaintiff_data.law_firm_id,
                 employment_status=plaintiff_data.employment_status,
                 monthly_income=plaintiff_data.monthly_income,
@@ -198,7 +314,10 @@ async def create_plaintiff(plaintiff_data: PlaintiffCreate, request: Request):
                                 "phone": plaintiff.phone,
                                 "case_type": plaintiff.case_type.value,
                                 "case_description": plaintiff.case_description,
-                                "incident_date": plaintiff.incident_date,
+                                "incident_date": (
+                                    plaintiff.incident_date.isoformat()
+                                    if plaintiff.incident_date else None
+                                ),
                                 "monthly_income": plaintiff.monthly_income,
                                 "monthly_expenses": plaintiff.monthly_expenses,
                                 "employment_status": plaintiff.employment_status,
@@ -230,16 +349,107 @@ async def create_plaintiff(plaintiff_data: PlaintiffCreate, request: Request):
         logger.error(f"Failed to create plaintiff: {e}")
         raise HTTPException(status_code=500, detail="Failed to create plaintiff")
 
+# Single round-trip over the plaintiffs table: GROUPING SETS yields the
+# per-status, per-type, and per-state breakdowns plus the grand-total row
+# from one sequential scan. GROUPING() identifies which set produced each
+# row: state is nullable, so a NULL-state row from the (state) set would
+# otherwise be indistinguishable from the grand total.
+_PLAINTIFF_STATS_SQL = text(
+    """
+    SELECT
+        GROUPING(case_status, case_type, state) AS grouping_id,
+        case_status,
+        case_type,
+        state,
+        COUNT(*) AS row_count,
+        AVG(risk_score) AS avg_risk_score,
+        COUNT(*) FILTER (WHERE risk_score > 0.7) AS high_risk_count,
+        COUNT(*) FILTER (WHERE case_status::text = ANY(:qualified))
+            AS qualified_count
+    FROM plaintiffs
+    GROUP BY GROUPING SETS ((case_status), (case_type), (state), ())
+    """
+)
+
+
+@router.get("/stats")
+@require_permissions("read:plaintiffs")
+async def get_plaintiff_stats(request: Request):
+    """Get plaintiff statistics for dashboard."""
+    try:
+        async with get_database_session() as session:
+            result = await session.execute(
+                _PLAINTIFF_STATS_SQL,
+                {"qualified": [status.name for status in _QUALIFIED_STATUSES]},
+            )
+
+            by_status = {}
+            by_case_type = {}
+            by_state = {}
+            total_count = 0
+            average_risk_score = None
+            high_risk_count = 0
+            qualified_count = 0
+            # grouping_id bits follow the GROUPING() argument order
+            # (case_status, case_type, state); a set bit means that
+            # column was aggregated away in this row.
+            for row in result:
+                if row.grouping_id == 0b011:
+                    by_status[CaseStatus[row.case_status]] = row.row_count
+                elif row.grouping_id == 0b101:
+                    by_case_type[CaseType[row.case_type]] = row.row_count
+                elif row.grouping_id == 0b110:
+                    if row.state is not None:
+                        by_state[row.state] = row.row_count
+                else:
+                    total_count = row.row_count
+                    average_risk_score = (
+                        float(row.avg_risk_score)
+                        if row.avg_risk_score is not None else None
+                    )
+                    high_risk_count = row.high_risk_count
+                    qualified_count = row.qualified_count
+
+            # Counts come straight from the aggregate query, so skip
+            # re-validating them through the schema.
+            stats = PlaintiffStats.model_construct(
+                total_count=total_count,
+                by_status=by_status,
+                by_case_type=by_case_type,
+                by_state=by_state,
+                average_risk_score=average_risk_score,
+                high_risk_count=high_risk_count,
+                qualified_count=qualified_count,
+            )
+            return Response(
+                content=stats.model_dump_json(),
+                media_type="application/json",
+            )
+
+    except Exception as e:
+        logger.error(f"Failed to get plaintiff stats: {e}")
+        raise HTTPException(
+            status_code=500, detail="Failed to retrieve plaintiff statistics"
+        )
+
+
 @router.get("/{plaintiff_id}")
 @require_permissions("read:plaintiffs")
 async def get_plaintiff(plaintiff_id: UUID, request: Request):
     """Get specific plaintiff details."""
     try:
         async with get_database_session() as session:
-            stmt = select(Plaintiff).where(Plaintiff.id == plaintiff_id)
+            stmt = (
+                select(Plaintiff)
+                .where(Plaintiff.id == plaintiff_id)
+                .options(
+                    undefer(Plaintiff.case_description),
+                    undefer(Plaintiff.notes),
+                )
+            )
             result = await session.execute(stmt)
             plaintiff = result.scalar_one_or_none()
-            
+
             if not plaintiff:
                 raise HTTPException(status_code=404, detail="Plaintiff not found")
             
@@ -2,6 +2,7 @@
 
 from typing import AsyncGenerator, Optional, Union
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.pool import StaticPool
@@ -45,7 +46,15 @@ def create_database_engine(url: Optional[str] = None):
         "pool_size": settings.database.pool_size,
         "max_overflow": settings.database.max_overflow,
         "pool_pre_ping": True,  # Validate connections before use
-        "pool_recycle": 3600,   # Recycle connections every hour
+        "pool_recycle": settings.database.pool_recycle,
+        # LIFO checkout hands out the most recently used connection,
+        # which is still warm in Postgres' plan and buffer caches, and
+        # lets idle extras age out and be recycled.
+        "pool_use_lifo": True,
+        # orjson encodes/decodes JSON(B) column values in C instead of
+        # the stdlib json module, once per row on insert/fetch.
+        "json_serializer": lambda value: orjson.dumps(value).decode(),
+        "json_deserializer": orjson.loads,
     }
     
     # Handle SQLite for testing
@@ -60,6 +69,7 @@ def create_database_engine(url: Optional[str] = None):
         del engine_kwargs["pool_size"]
         del engine_kwargs["max_overflow"]
         del engine_kwargs["pool_recycle"]
+        del engine_kwargs["pool_use_lifo"]
     
     return create_async_engine(database_url, **engine_kwargs)
 
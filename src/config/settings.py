@@ -12,10 +12,12 @@ class DatabaseSettings(BaseSettings):
     
     url: str = Field("sqlite+aiosqlite:///./app.db", env="DATABASE_URL")
     echo: bool = Field(False, env="DATABASE_ECHO")
-    pool_size: int = Field(20, env="DATABASE_POOL_SIZE")
-    max_overflow: int = Field(30, env="DATABASE_MAX_OVERFLOW")
+    # Sized for bulk sync, which opens a session per concurrent task:
+    # the base pool covers twice the default batch fan-out.
+    pool_size: int = Field(40, env="DATABASE_POOL_SIZE")
+    max_overflow: int = Field(20, env="DATABASE_MAX_OVERFLOW")
     pool_timeout: int = Field(30, env="DATABASE_POOL_TIMEOUT")
-    pool_recycle: int = Field(3600, env="DATABASE_POOL_RECYCLE")
+    pool_recycle: int = Field(1800, env="DATABASE_POOL_RECYCLE")
 
 
 class RedisSettings(BaseSettings):
@@ -58,6 +60,11 @@ class AISettings(BaseSettings):
     anthropic_api_key: str = Field("test-key", env="ANTHROPIC_API_KEY")
     openai_model: str = Field("gpt-3.5-turbo", env="OPENAI_MODEL")
     openai_max_tokens: int = Field(2000, env="OPENAI_MAX_TOKENS")
+    openai_max_concurrency: int = Field(8, env="OPENAI_MAX_CONCURRENCY")
+    openai_requests_per_minute: int = Field(500, env="OPENAI_REQUESTS_PER_MINUTE")
+    openai_tokens_per_minute: int = Field(90000, env="OPENAI_TOKENS_PER_MINUTE")
+    openai_cache_dir: str = Field("./cache/openai", env="OPENAI_CACHE_DIR")
+    openai_cache_ttl: int = Field(86400, env="OPENAI_CACHE_TTL")
     default_model: str = "gpt-3.5-turbo"
     max_tokens: int = 2000
     temperature: float = 0.7
@@ -97,6 +104,10 @@ class FileStorageSettings(BaseSettings):
     max_file_size: str = Field("50MB", env="MAX_FILE_SIZE")
     allowed_file_types: str = Field("pdf,doc,docx,txt,png,jpg,jpeg", env="ALLOWED_FILE_TYPES")
     email_templates_path: str = Field("./templates/email", env="EMAIL_TEMPLATES_PATH")
+    # Content-hash algorithm for stored files ("sha256", "blake2b", or
+    # "blake3" when the blake3 package is installed). Stored filenames
+    # embed the algorithm, so switching never collides with old entries.
+    file_hash_algo: str = Field("sha256", env="FILE_HASH_ALGO")
     
     @property
     def allowed_file_types_list(self) -> List[str]:
@@ -138,6 +149,9 @@ class Settings(BaseSettings):
     # Application
     environment: str = Field("development", env="ENVIRONMENT")
     debug: bool = Field(False, env="DEBUG")
+    # When true, response schemas hydrate DB rows via model_construct and
+    # skip re-validation; disable in dev to catch schema/model drift.
+    trust_db_payloads: bool = Field(True, env="TRUST_DB_PAYLOADS")
     log_level: str = Field("INFO", env="LOG_LEVEL")
     api_v1_str: str = Field("/api/v1", env="API_V1_STR")
     project_name: str = Field("AI CRM Multi-Agent System", env="PROJECT_NAME")
@@ -232,7 +246,12 @@ class Settings(BaseSettings):
     @property
     def TEST_DATABASE_URL(self) -> str:
         return "sqlite+aiosqlite:///./test.db"
-    
+
+    # Convenience property for file storage
+    @property
+    def FILE_HASH_ALGO(self) -> str:
+        return self.file_storage.file_hash_algo
+
     # Convenience properties for server
     @property
     def API_HOST(self) -> str:
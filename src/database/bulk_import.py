@@ -0,0 +1,129 @@
+"""Bulk plaintiff import via asyncpg's binary COPY protocol."""
+
+import uuid
+from typing import Any, Dict, Iterable, Sequence
+
+import orjson
+
+from ..models.database.plaintiff import CaseStatus, CaseType, ContactMethod
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Columns shipped over COPY, in table order. COPY bypasses ORM-side
+# defaults, so every NOT NULL column without a *server* default must be
+# listed here; the remaining unlisted columns (created_at, updated_at,
+# country, booleans) are covered by server defaults.
+PLAINTIFF_COPY_COLUMNS = (
+    "id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "case_type",
+    "case_status",
+    "preferred_contact_method",
+    "lead_source",
+    "lead_source_details",
+    "pipedrive_person_id",
+)
+
+
+def _to_record(row: Dict[str, Any]) -> Sequence[Any]:
+    """Convert one import dict into a COPY tuple in column order."""
+    case_type = row.get("case_type", CaseType.OTHER)
+    case_status = row.get("case_status", CaseStatus.INITIAL)
+    contact_method = row.get("preferred_contact_method", ContactMethod.EMAIL)
+    details = row.get("lead_source_details")
+    return (
+        row.get("id") or uuid.uuid4(),
+        row["first_name"],
+        row["last_name"],
+        row["email"],
+        row.get("phone"),
+        # SQLEnum columns store the enum *name* in Postgres
+        case_type.name if isinstance(case_type, CaseType) else case_type,
+        case_status.name if isinstance(case_status, CaseStatus) else case_status,
+        contact_method.name
+        if isinstance(contact_method, ContactMethod)
+        else contact_method,
+        row.get("lead_source"),
+        None if details is None else orjson.dumps(details).decode(),
+        row.get("pipedrive_person_id"),
+    )
+
+
+async def copy_plaintiffs(engine, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Bulk-load plaintiff rows with one binary COPY round-trip.
+
+    For 10K+ row imports this replaces per-row INSERT plus unit-of-work
+    bookkeeping with a single statement the server parses in C.
+
+    Args:
+        engine: Async engine bound to the target database.
+        rows: Import dicts with at least first_name/last_name/email.
+
+    Returns:
+        int: Number of rows loaded.
+    """
+    records = [_to_record(row) for row in rows]
+    if not records:
+        return 0
+
+    async with engine.begin() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "plaintiffs",
+            records=records,
+            columns=list(PLAINTIFF_COPY_COLUMNS),
+        )
+
+    logger.info("Bulk plaintiff import completed", rows=len(records))
+    return len(records)
+
+
+async def copy_upsert_plaintiffs(engine, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Bulk upsert keyed on pipedrive_person_id (Pipedrive backfill path).
+
+    Rows are COPYed into a TEMP table, then merged in one
+    INSERT ... SELECT ... ON CONFLICT DO UPDATE statement.
+
+    Args:
+        engine: Async engine bound to the target database.
+        rows: Import dicts; each must carry pipedrive_person_id.
+
+    Returns:
+        int: Number of rows shipped to the server.
+    """
+    records = [_to_record(row) for row in rows]
+    if not records:
+        return 0
+
+    columns = ", ".join(PLAINTIFF_COPY_COLUMNS)
+    async with engine.begin() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        await driver.execute(
+            "CREATE TEMP TABLE _plaintiff_import "
+            "(LIKE plaintiffs INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        await driver.copy_records_to_table(
+            "_plaintiff_import",
+            records=records,
+            columns=list(PLAINTIFF_COPY_COLUMNS),
+        )
+        await driver.execute(
+            f"INSERT INTO plaintiffs ({columns}) "
+            f"SELECT {columns} FROM _plaintiff_import "
+            "ON CONFLICT (pipedrive_person_id) DO UPDATE SET "
+            "first_name = excluded.first_name, "
+            "last_name = excluded.last_name, "
+            "email = excluded.email, "
+            "phone = excluded.phone, "
+            "updated_at = now()"
+        )
+
+    logger.info("Bulk plaintiff upsert completed", rows=len(records))
+    return len(records)
@@ -4,8 +4,9 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Column, DateTime, String
-from sqlalchemy.dialects.postgresql import UUID
+import orjson
+from sqlalchemy import Column, DateTime, String, TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -13,6 +14,24 @@ from sqlalchemy.sql import func
 Base = declarative_base()
 
 
+class FastJSONB(TypeDecorator):
+    """JSONB column type that decodes with orjson.
+
+    Binding is left to the engine-level json_serializer (also orjson, see
+    config.database) so values are encoded exactly once; this decorator
+    only guards the result path, decoding in C if the driver hands back
+    text instead of an already-parsed object.
+    """
+
+    impl = JSONB
+    cache_ok = True
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        if isinstance(value, (str, bytes)):
+            return orjson.loads(value)
+        return value
+
+
 class UUIDMixin:
     """Mixin to add UUID primary key to models."""
     
@@ -1,7 +1,10 @@
 """Plaintiff model for the AI CRM system."""
 
+import hashlib
+import hmac
 from sqlalchemy import (
     Column,
+    Date,
     String,
     Text,
     Integer,
@@ -9,13 +12,16 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Enum as SQLEnum,
-    JSON,
+    Index,
+    LargeBinary,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, deferred, relationship
 import enum
 
-from .base import BaseModel, AuditMixin
+from .base import BaseModel, AuditMixin, FastJSONB
 
 
 class CaseType(enum.Enum):
@@ -57,6 +63,17 @@ class ContactMethod(enum.Enum):
     MAIL = "mail"
 
 
+# Statuses that count as funding-qualified; frozenset gives O(1)
+# membership checks in bulk filters without rebuilding a list per call.
+_QUALIFIED_STATUSES = frozenset({
+    CaseStatus.QUALIFIED,
+    CaseStatus.DOCUMENT_COLLECTION,
+    CaseStatus.UNDERWRITING,
+    CaseStatus.APPROVED,
+    CaseStatus.FUNDED,
+})
+
+
 class Plaintiff(BaseModel, AuditMixin):
     """
     Plaintiff model representing funding recipients.
@@ -71,14 +88,12 @@ class Plaintiff(BaseModel, AuditMixin):
     first_name = Column(
         String(100),
         nullable=False,
-        index=True,
         comment="Plaintiff's first name",
     )
     
     last_name = Column(
         String(100),
         nullable=False,
-        index=True,
         comment="Plaintiff's last name",
     )
     
@@ -108,10 +123,9 @@ class Plaintiff(BaseModel, AuditMixin):
     )
     
     date_of_birth = Column(
-        "date_of_birth",
-        String(10),  # YYYY-MM-DD format
+        Date,
         nullable=True,
-        comment="Date of birth in YYYY-MM-DD format",
+        comment="Date of birth",
     )
     
     social_security_number = Column(
@@ -120,6 +134,13 @@ class Plaintiff(BaseModel, AuditMixin):
         comment="Encrypted social security number",
     )
     
+    ssn_hmac = Column(
+        LargeBinary(32),
+        nullable=True,
+        index=True,
+        comment="Deterministic HMAC-SHA256 of the SSN for indexed exact-match lookup",
+    )
+    
     # Address Information
     address_line_1 = Column(
         String(255),
@@ -136,28 +157,25 @@ class Plaintiff(BaseModel, AuditMixin):
     city = Column(
         String(100),
         nullable=True,
-        index=True,
         comment="City",
     )
     
     state = Column(
         String(2),
         nullable=True,
-        index=True,
         comment="State abbreviation",
     )
     
     zip_code = Column(
         String(10),
         nullable=True,
-        index=True,
         comment="ZIP/postal code",
     )
     
     country = Column(
         String(3),
-        nullable=True,
-        default="USA",
+        nullable=False,
+        server_default=text("'USA'"),
         comment="Country code",
     )
     
@@ -177,15 +195,16 @@ class Plaintiff(BaseModel, AuditMixin):
         comment="Current status of the case",
     )
     
-    case_description = Column(
-        Text,
-        nullable=True,
-        comment="Detailed description of the case",
+    case_description = deferred(
+        Column(
+            Text,
+            nullable=True,
+            comment="Detailed description of the case",
+        )
     )
     
     incident_date = Column(
-        "incident_date",
-        String(10),  # YYYY-MM-DD format
+        Date,
         nullable=True,
         comment="Date of the incident",
     )
@@ -229,7 +248,7 @@ class Plaintiff(BaseModel, AuditMixin):
     bank_account_verified = Column(
         Boolean,
         nullable=False,
-        default=False,
+        server_default=text("false"),
         comment="Whether bank account has been verified",
     )
     
@@ -247,15 +266,17 @@ class Plaintiff(BaseModel, AuditMixin):
     )
     
     risk_factors = Column(
-        JSON,
+        FastJSONB,
         nullable=True,
         comment="JSON array of identified risk factors",
     )
     
-    underwriting_notes = Column(
-        Text,
-        nullable=True,
-        comment="Underwriting notes and comments",
+    underwriting_notes = deferred(
+        Column(
+            Text,
+            nullable=True,
+            comment="Underwriting notes and comments",
+        )
     )
     
     # Communication Preferences
@@ -266,16 +287,18 @@ class Plaintiff(BaseModel, AuditMixin):
         comment="Preferred method of contact",
     )
     
-    communication_notes = Column(
-        Text,
-        nullable=True,
-        comment="Special communication instructions",
+    communication_notes = deferred(
+        Column(
+            Text,
+            nullable=True,
+            comment="Special communication instructions",
+        )
     )
     
     opt_in_marketing = Column(
         Boolean,
         nullable=False,
-        default=False,
+        server_default=text("false"),
         comment="Whether plaintiff opted in to marketing communications",
     )
     
@@ -283,10 +306,14 @@ class Plaintiff(BaseModel, AuditMixin):
     pipedrive_person_id = Column(
         Integer,
         nullable=True,
-        unique=True,
-        index=True,
         comment="Pipedrive person ID for synchronization",
     )
+
+    pipedrive_person_hash = Column(
+        String(16),
+        nullable=True,
+        comment="Content hash of the last person payload sent to Pipedrive",
+    )
     
     pipedrive_deal_id = Column(
         Integer,
@@ -303,30 +330,80 @@ class Plaintiff(BaseModel, AuditMixin):
     )
     
     lead_source_details = Column(
-        JSON,
+        FastJSONB,
         nullable=True,
         comment="Additional details about the lead source",
     )
     
     # Metadata
     tags = Column(
-        JSON,
+        FastJSONB,
         nullable=True,
         comment="JSON array of tags for categorization",
     )
     
     custom_fields = Column(
-        JSON,
+        FastJSONB,
         nullable=True,
         comment="JSON object for custom field values",
     )
     
-    notes = Column(
-        Text,
-        nullable=True,
-        comment="General notes about the plaintiff",
+    notes = deferred(
+        Column(
+            Text,
+            nullable=True,
+            comment="General notes about the plaintiff",
+        )
     )
-    
+
+    # Computed server-side so list queries ship the display name as a
+    # plain scalar instead of running per-row Python concatenation.
+    # Includes middle_name to match PlaintiffResponse.full_name; name
+    # *search* still filters on first+last (the trigram index
+    # expressions below).
+    full_name = column_property(
+        first_name
+        + func.coalesce(" " + middle_name, "")
+        + " "
+        + last_name
+    )
+
+    # Trigram (pg_trgm) GIN indexes so that `%term%` name/email searches
+    # can use an index scan instead of a sequential scan. Search code must
+    # filter on the same lowered expressions for these to be used.
+    __table_args__ = (
+        Index(
+            "idx_plaintiffs_fullname_trgm",
+            func.lower(first_name + " " + last_name),
+            postgresql_using="gin",
+            postgresql_ops={"lower_1": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_plaintiffs_email_trgm",
+            func.lower(email),
+            postgresql_using="gin",
+            postgresql_ops={"lower_1": "gin_trgm_ops"},
+        ),
+        # Leftmost-prefix composite replaces the three single-column
+        # location indexes: state-only and state+city filters still get
+        # index scans, with two fewer B-trees to maintain per write.
+        Index("idx_plaintiffs_location", state, city, zip_code),
+        # Covering index: sync lookups by Pipedrive person ID read only a
+        # handful of fields, so INCLUDE lets them run as index-only scans.
+        Index(
+            "idx_plaintiffs_pipedrive_person_covering",
+            pipedrive_person_id,
+            unique=True,
+            postgresql_include=[
+                "id",
+                "first_name",
+                "last_name",
+                "email",
+                "case_status",
+            ],
+        ),
+    )
+
     # Relationships
     law_firm = relationship(
         "LawFirm",
@@ -347,44 +424,45 @@ class Plaintiff(BaseModel, AuditMixin):
         cascade="all, delete-orphan",
     )
     
+    # raise_on_sql: these collections are large and nothing should fault
+    # them in lazily one parent at a time. Callers that need them must opt
+    # in with selectinload() at the query site, which also makes accidental
+    # N+1 access fail loudly instead of silently issuing queries.
     documents = relationship(
         "Document",
         back_populates="plaintiff",
-        lazy="select",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
     
     communications = relationship(
         "Communication",
         back_populates="plaintiff",
-        lazy="select",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
     
     contracts = relationship(
         "Contract",
         back_populates="plaintiff",
-        lazy="select",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
     
     def __repr__(self) -> str:
         """Return string representation of the plaintiff."""
-        return (
-            f"<Plaintiff(id={self.id}, "
-            f"name='{self.first_name} {self.last_name}', "
-            f"email='{self.email}', "
-            f"status='{self.case_status.value}')>"
-        )
-    
-    @property
-    def full_name(self) -> str:
-        """Get the plaintiff's full name."""
-        parts = [self.first_name]
-        if self.middle_name:
-            parts.append(self.middle_name)
-        parts.append(self.last_name)
-        return " ".join(parts)
+        # Cached on the instance: repr is re-run for every logged statement
+        # parameter, and the formatted string never changes per instance.
+        cached = self.__dict__.get("_repr")
+        if cached is None:
+            cached = (
+                f"<Plaintiff(id={self.id}, "
+                f"name='{self.first_name} {self.last_name}', "
+                f"email='{self.email}', "
+                f"status='{self.case_status.value}')>"
+            )
+            self.__dict__["_repr"] = cached
+        return cached
     
     @property
     def full_address(self) -> str:
@@ -404,15 +482,29 @@ class Plaintiff(BaseModel, AuditMixin):
         
         return ", ".join(parts)
     
+    @staticmethod
+    def compute_ssn_hmac(ssn: str, key: bytes) -> bytes:
+        """Compute the deterministic lookup digest for an SSN.
+        
+        Exact-match lookups filter on ssn_hmac (a single B-tree probe)
+        instead of decrypting every row; OpenSSL runs the HMAC-SHA256
+        with hardware SHA instructions where available.
+        """
+        return hmac.new(key, ssn.encode(), hashlib.sha256).digest()
+    
+    def set_social_security_number(self, ssn, key: bytes) -> None:
+        """Set the SSN column together with its lookup digest."""
+        self.social_security_number = ssn
+        self.ssn_hmac = None if ssn is None else self.compute_ssn_hmac(ssn, key)
+    
     def is_qualified(self) -> bool:
-        """Check if the plaintiff is qualified for funding."""
-        return self.case_status in [
-            CaseStatus.QUALIFIED,
-            CaseStatus.DOCUMENT_COLLECTION,
-            CaseStatus.UNDERWRITING,
-            CaseStatus.APPROVED,
-            CaseStatus.FUNDED,
-        ]
+        """Check if the plaintiff is qualified for funding.
+        
+        For query-side filtering prefer
+        ``Plaintiff.case_status.in_(_QUALIFIED_STATUSES)`` so the check
+        runs in SQL against the case_status index.
+        """
+        return self.case_status in _QUALIFIED_STATUSES
     
     def has_high_risk(self) -> bool:
         """Check if the plaintiff has a high risk score."""
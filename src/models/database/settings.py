@@ -2,12 +2,12 @@
 
 from datetime import datetime
 from typing import Any, Dict, Optional
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, ForeignKey, Index
+from sqlalchemy import Column, Integer, Float, String, Text, Boolean, DateTime, ForeignKey, Index, select, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
 import json
 
-from .base import Base
+from .base import Base, FastJSONB
 
 
 class SettingsCategory(Base):
@@ -26,7 +26,8 @@ class SettingsCategory(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    settings = relationship("Setting", back_populates="category", cascade="all, delete-orphan")
+    # selectin avoids the N+1 when a settings page iterates categories
+    settings = relationship("Setting", back_populates="category", lazy="selectin", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<SettingsCategory(name='{self.name}', display_name='{self.display_name}')>"
@@ -45,9 +46,16 @@ class Setting(Base):
     data_type = Column(String(50), nullable=False)  # string, integer, float, boolean, json, select
     default_value = Column(Text)
     current_value = Column(Text)
-    validation_rules = Column(JSON)  # JSON schema for validation
+    # Typed value columns: at most one is populated (chosen by data_type)
+    # so hot reads return the stored value without per-row string parsing.
+    value_text = Column(Text)
+    value_int = Column(Integer)
+    value_float = Column(Float)
+    value_bool = Column(Boolean)
+    value_json = Column(FastJSONB)
+    validation_rules = Column(FastJSONB)  # JSON schema for validation
     ui_component = Column(String(50))  # input, textarea, select, checkbox, switch, slider, etc.
-    ui_options = Column(JSON)  # Additional UI configuration
+    ui_options = Column(FastJSONB)  # Additional UI configuration
     is_sensitive = Column(Boolean, default=False)  # For passwords, API keys, etc.
     is_readonly = Column(Boolean, default=False)
     is_required = Column(Boolean, default=False)
@@ -59,22 +67,48 @@ class Setting(Base):
     
     # Relationships
     category = relationship("SettingsCategory", back_populates="settings")
-    user_settings = relationship("UserSetting", back_populates="setting", cascade="all, delete-orphan")
+    user_settings = relationship("UserSetting", back_populates="setting", lazy="selectin", cascade="all, delete-orphan")
     audit_logs = relationship("SettingAuditLog", back_populates="setting", cascade="all, delete-orphan")
     
     # Indexes for performance
     __table_args__ = (
-        Index('idx_settings_category_key', 'category_id', 'key'),
-        Index('idx_settings_active', 'is_active'),
+        # Ordered to match the list-page query (WHERE category_id = ? AND
+        # is_active = true ORDER BY sort_order): rows come back pre-sorted
+        # straight from the index, with no Sort node.
+        Index('idx_settings_category_sort', 'category_id', 'is_active', 'sort_order', 'key'),
+        # Partial index: reads almost always filter is_active = true, so
+        # indexing only active rows keeps it small and hot in cache while
+        # also covering (category_id, key) lookups on the active path.
+        Index(
+            'idx_settings_active_true',
+            'category_id',
+            'key',
+            postgresql_where=text('is_active = true'),
+        ),
     )
     
+    _TYPED_COLUMNS = {
+        'boolean': 'value_bool',
+        'integer': 'value_int',
+        'float': 'value_float',
+        'json': 'value_json',
+    }
+
     @hybrid_property
     def value(self):
         """Get the current value with proper type conversion."""
+        # Prefer the typed column: no parsing or branching on the value
+        # itself, just a fetch of an already-typed scalar.
+        typed = getattr(self, self._TYPED_COLUMNS.get(self.data_type, 'value_text'))
+        if typed is not None:
+            return typed
+
+        # Fall back to parsing for rows written before the typed columns
+        # existed (or defaults that were never explicitly set).
         value = self.current_value if self.current_value is not None else self.default_value
         if value is None:
             return None
-            
+
         if self.data_type == 'boolean':
             return str(value).lower() in ('true', '1', 'yes', 'on')
         elif self.data_type == 'integer':
@@ -85,16 +119,30 @@ class Setting(Base):
             return json.loads(value) if isinstance(value, str) else value
         else:
             return str(value)
-    
+
     @value.setter
     def value(self, new_value):
         """Set the current value with proper serialization."""
+        for column in ('value_text', 'value_int', 'value_float', 'value_bool', 'value_json'):
+            setattr(self, column, None)
+
         if new_value is None:
             self.current_value = None
         elif self.data_type == 'json':
             self.current_value = json.dumps(new_value) if not isinstance(new_value, str) else new_value
+            self.value_json = json.loads(new_value) if isinstance(new_value, str) else new_value
+        elif self.data_type == 'boolean':
+            self.current_value = str(new_value)
+            self.value_bool = str(new_value).lower() in ('true', '1', 'yes', 'on')
+        elif self.data_type == 'integer':
+            self.current_value = str(new_value)
+            self.value_int = int(new_value)
+        elif self.data_type == 'float':
+            self.current_value = str(new_value)
+            self.value_float = float(new_value)
         else:
             self.current_value = str(new_value)
+            self.value_text = str(new_value)
     
     def __repr__(self):
         return f"<Setting(key='{self.key}', value='{self.value}')>"
@@ -151,9 +199,15 @@ class AgentSetting(Base):
     agent_id = Column(String(100), nullable=True, index=True)  # For specific agent instances
     setting_key = Column(String(200), nullable=False)
     setting_value = Column(Text)
+    # Typed value columns, mirroring Setting: one populated per row.
+    value_text = Column(Text)
+    value_int = Column(Integer)
+    value_float = Column(Float)
+    value_bool = Column(Boolean)
+    value_json = Column(FastJSONB)
     data_type = Column(String(50), default='string')
     is_enabled = Column(Boolean, default=True)
-    validation_schema = Column(JSON)
+    validation_schema = Column(FastJSONB)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -166,9 +220,13 @@ class AgentSetting(Base):
     @hybrid_property
     def typed_value(self):
         """Get the value with proper type conversion."""
+        typed = getattr(self, Setting._TYPED_COLUMNS.get(self.data_type, 'value_text'))
+        if typed is not None:
+            return typed
+
         if self.setting_value is None:
             return None
-            
+
         if self.data_type == 'boolean':
             return str(self.setting_value).lower() in ('true', '1', 'yes', 'on')
         elif self.data_type == 'integer':
@@ -179,16 +237,30 @@ class AgentSetting(Base):
             return json.loads(self.setting_value) if isinstance(self.setting_value, str) else self.setting_value
         else:
             return str(self.setting_value)
-    
+
     @typed_value.setter
     def typed_value(self, value):
         """Set the value with proper serialization."""
+        for column in ('value_text', 'value_int', 'value_float', 'value_bool', 'value_json'):
+            setattr(self, column, None)
+
         if value is None:
             self.setting_value = None
         elif self.data_type == 'json':
             self.setting_value = json.dumps(value) if not isinstance(value, str) else value
+            self.value_json = json.loads(value) if isinstance(value, str) else value
+        elif self.data_type == 'boolean':
+            self.setting_value = str(value)
+            self.value_bool = str(value).lower() in ('true', '1', 'yes', 'on')
+        elif self.data_type == 'integer':
+            self.setting_value = str(value)
+            self.value_int = int(value)
+        elif self.data_type == 'float':
+            self.setting_value = str(value)
+            self.value_float = float(value)
         else:
             self.setting_value = str(value)
+            self.value_text = str(value)
     
     def __repr__(self):
         return f"<AgentSetting(agent_type='{self.agent_type}', key='{self.setting_key}', value='{self.setting_value}')>"
@@ -212,6 +284,21 @@ class SettingAuditLog(Base):
     # Relationships
     setting = relationship("Setting", back_populates="audit_logs")
     
+    @classmethod
+    def recent_for_settings(cls, setting_ids, limit=50):
+        """Build one batched query for recent audit entries of many settings.
+        
+        Audit logs stay lazy on the relationship (they can be large); callers
+        rendering a settings page should run this single IN (...) query
+        instead of touching `setting.audit_logs` per row.
+        """
+        return (
+            select(cls)
+            .where(cls.setting_id.in_(setting_ids))
+            .order_by(cls.created_at.desc())
+            .limit(limit)
+        )
+    
     def __repr__(self):
         return f"<SettingAuditLog(setting_id={self.setting_id}, user_id={self.user_id}, created_at='{self.created_at}')>"
 
@@ -227,7 +314,7 @@ class SettingsProfile(Base):
     description = Column(Text)
     is_default = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
-    settings_data = Column(JSON)  # Complete settings snapshot
+    settings_data = Column(FastJSONB)  # Complete settings snapshot
     created_by = Column(Integer, nullable=True)  # User who created this profile
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,108 +1,78 @@
 """Pydantic schemas for API validation and serialization."""
 
-from .common import BaseSchema, PaginationParams, PaginationResponse
-from .plaintiff import (
-    PlaintiffBase,
-    PlaintiffCreate,
-    PlaintiffUpdate,
-    PlaintiffResponse,
-    PlaintiffList,
-)
-from .law_firm import (
-    LawFirmBase,
-    LawFirmCreate,
-    LawFirmUpdate,
-    LawFirmResponse,
-    LawFirmList,
-)
-from .lawyer import (
-    LawyerBase,
-    LawyerCreate,
-    LawyerUpdate,
-    LawyerResponse,
-    LawyerList,
-)
-from .case import (
-    CaseBase,
-    CaseCreate,
-    CaseUpdate,
-    CaseResponse,
-    CaseList,
-)
-from .document import (
-    DocumentBase,
-    DocumentCreate,
-    DocumentUpdate,
-    DocumentResponse,
-    DocumentList,
-)
-from .communication import (
-    CommunicationBase,
-    CommunicationCreate,
-    CommunicationUpdate,
-    CommunicationResponse,
-    CommunicationList,
-)
-from .contract import (
-    ContractBase,
-    ContractCreate,
-    ContractUpdate,
-    ContractResponse,
-    ContractList,
-)
+from importlib import import_module
 
-__all__ = [
+# Map each exported name to its submodule. Submodules load lazily
+# (PEP 562) on first attribute access: importing the package no longer
+# builds every pydantic-core schema in the project up front, and
+# consumers of one entity's schemas don't pay for the rest.
+_SCHEMA_MODULES = {
     # Common schemas
-    "BaseSchema",
-    "PaginationParams",
-    "PaginationResponse",
-    
+    "BaseSchema": "common",
+    "PaginationParams": "common",
+    "PaginationResponse": "common",
+
     # Plaintiff schemas
-    "PlaintiffBase",
-    "PlaintiffCreate",
-    "PlaintiffUpdate",
-    "PlaintiffResponse",
-    "PlaintiffList",
-    
+    "PlaintiffBase": "plaintiff",
+    "PlaintiffCreate": "plaintiff",
+    "PlaintiffUpdate": "plaintiff",
+    "PlaintiffResponse": "plaintiff",
+    "PlaintiffList": "plaintiff",
+
     # Law firm schemas
-    "LawFirmBase",
-    "LawFirmCreate",
-    "LawFirmUpdate",
-    "LawFirmResponse",
-    "LawFirmList",
-    
+    "LawFirmBase": "law_firm",
+    "LawFirmCreate": "law_firm",
+    "LawFirmUpdate": "law_firm",
+    "LawFirmResponse": "law_firm",
+    "LawFirmList": "law_firm",
+
     # Lawyer schemas
-    "LawyerBase",
-    "LawyerCreate",
-    "LawyerUpdate",
-    "LawyerResponse",
-    "LawyerList",
-    
+    "LawyerBase": "lawyer",
+    "LawyerCreate": "lawyer",
+    "LawyerUpdate": "lawyer",
+    "LawyerResponse": "lawyer",
+    "LawyerList": "lawyer",
+
     # Case schemas
-    "CaseBase",
-    "CaseCreate",
-    "CaseUpdate",
-    "CaseResponse",
-    "CaseList",
-    
+    "CaseBase": "case",
+    "CaseCreate": "case",
+    "CaseUpdate": "case",
+    "CaseResponse": "case",
+    "CaseList": "case",
+
     # Document schemas
-    "DocumentBase",
-    "DocumentCreate",
-    "DocumentUpdate",
-    "DocumentResponse",
-    "DocumentList",
-    
+    "DocumentBase": "document",
+    "DocumentCreate": "document",
+    "DocumentUpdate": "document",
+    "DocumentResponse": "document",
+    "DocumentList": "document",
+
     # Communication schemas
-    "CommunicationBase",
-    "CommunicationCreate",
-    "CommunicationUpdate",
-    "CommunicationResponse",
-    "CommunicationList",
-    
+    "CommunicationBase": "communication",
+    "CommunicationCreate": "communication",
+    "CommunicationUpdate": "communication",
+    "CommunicationResponse": "communication",
+    "CommunicationList": "communication",
+
     # Contract schemas
-    "ContractBase",
-    "ContractCreate",
-    "ContractUpdate",
-    "ContractResponse",
-    "ContractList",
-]
\ No newline at end of file
+    "ContractBase": "contract",
+    "ContractCreate": "contract",
+    "ContractUpdate": "contract",
+    "ContractResponse": "contract",
+    "ContractList": "contract",
+}
+
+__all__ = list(_SCHEMA_MODULES)
+
+
+def __getattr__(name):
+    """Resolve exported schemas on first access (PEP 562)."""
+    try:
+        module_name = _SCHEMA_MODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,18 +1,61 @@
 """Common Pydantic schemas and base classes."""
 
+import base64
+import binascii
+import hashlib
+import os
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 # Type variable for generic pagination
 T = TypeVar("T")
 
+# Scalar JSON value for flat payloads (filters, preferences, response
+# metadata). A concrete union lets pydantic-core pick a specialized
+# validator instead of the generic Any branch for every entry.
+JSONScalar = Union[str, int, float, bool, None]
+
+# Shared field patterns, declared once at import so every Field that
+# reuses a shape shares one pydantic-core-compiled regex.
+STATE_PATTERN = r"^[A-Z]{2}$"
+ZIP_PATTERN = r"^[0-9]{5}(-[0-9]{4})?$"
+PHONE_E164_PATTERN = r"^\+?[1-9]\d{1,14}$"
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
-    
+
+    # validate_assignment is off by default: nearly every schema here is
+    # built once and never mutated, and the flag installs a per-attribute
+    # validator that taxes each field set during construction. Schemas
+    # that genuinely mutate after construction extend MutableSchema.
+    model_config = ConfigDict(
+        from_attributes=True,
+        arbitrary_types_allowed=True,
+        str_strip_whitespace=True,
+        validate_assignment=False,
+        extra="forbid",
+    )
+
+
+class MutableSchema(BaseSchema):
+    """Base for schemas that are mutated after construction."""
+
     model_config = ConfigDict(
         from_attributes=True,
         arbitrary_types_allowed=True,
@@ -22,6 +65,18 @@ class BaseSchema(BaseModel):
     )
 
 
+# Configuration for read-only server outputs: frozen models skip the
+# assignment-validator chain entirely, and strings coming out of the DB
+# are already stripped, so the per-field .strip() pass is dropped too.
+RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,
+    frozen=True,
+    validate_assignment=False,
+    extra="ignore",
+    str_strip_whitespace=False,
+)
+
+
 class TimestampMixin(BaseSchema):
     """Mixin for schemas with timestamp fields."""
     
@@ -38,22 +93,61 @@ class TimestampMixin(BaseSchema):
 
 class UUIDMixin(BaseSchema):
     """Mixin for schemas with UUID primary key."""
-    
+
     id: UUID = Field(
         ...,
         description="Unique identifier",
     )
 
 
+class UUIDStrMixin(BaseSchema):
+    """
+    Mixin keeping the primary key in its canonical UUID string form.
+
+    For high-volume list items this skips the uuid.UUID() parse on the
+    way in and the hyphenated re-format on the way out; a fixed-length
+    check is sufficient for IDs that came straight from the database.
+    """
+
+    id: str = Field(
+        ...,
+        min_length=36,
+        max_length=36,
+        description="Unique identifier (canonical UUID string)",
+    )
+
+
+def encode_cursor(created_at: datetime, entity_id: UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{entity_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor back into its (created_at, id) keyset position."""
+    try:
+        timestamp, _, entity_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        )
+        return datetime.fromisoformat(timestamp), UUID(entity_id)
+    except (ValueError, UnicodeDecodeError, binascii.Error) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
 class PaginationParams(BaseSchema):
     """Schema for pagination parameters."""
-    
+
     page: int = Field(
         default=1,
         ge=1,
-        description="Page number (1-based)",
+        description="Page number (1-based); deprecated, prefer cursor",
     )
-    
+
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Keyset cursor from a previous response's next_cursor",
+    )
+
     size: int = Field(
         default=20,
         ge=1,
@@ -66,56 +160,83 @@ class PaginationParams(BaseSchema):
         description="Field to sort by",
     )
     
-    sort_order: Optional[str] = Field(
+    # Literal beats a regex here: pydantic-core checks membership with a
+    # hashed-set lookup instead of running the regex engine per instance.
+    sort_order: Literal["asc", "desc"] = Field(
         default="asc",
-        pattern="^(asc|desc)$",
         description="Sort order (asc or desc)",
     )
 
 
 class PaginationResponse(BaseSchema, Generic[T]):
     """Generic schema for paginated responses."""
-    
+
+    model_config = RESPONSE_CONFIG
+
     items: List[T] = Field(
         ...,
         description="List of items",
     )
     
-    total: int = Field(
-        ...,
-        ge=0,
-        description="Total number of items",
-    )
-    
-    page: int = Field(
-        ...,
-        ge=1,
-        description="Current page number",
-    )
-    
     size: int = Field(
         ...,
         ge=1,
         description="Items per page",
     )
-    
-    pages: int = Field(
-        ...,
+
+    # Offset-mode fields; None when the page was fetched by cursor,
+    # where counting every matching row would defeat the keyset scan.
+    total: Optional[int] = Field(
+        default=None,
         ge=0,
-        description="Total number of pages",
+        description="Total number of items (offset pagination only)",
     )
-    
-    has_next: bool = Field(
-        ...,
-        description="Whether there is a next page",
+
+    page: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Current page number (offset pagination only)",
     )
-    
-    has_prev: bool = Field(
-        ...,
-        description="Whether there is a previous page",
+
+    pages: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Total number of pages (offset pagination only)",
+    )
+
+    has_next: Optional[bool] = Field(
+        default=None,
+        description="Whether there is a next page (offset pagination only)",
+    )
+
+    has_prev: Optional[bool] = Field(
+        default=None,
+        description="Whether there is a previous page (offset pagination only)",
+    )
+
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page (keyset pagination)",
+    )
+
+    prev_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the previous page (keyset pagination)",
     )
 
 
+@lru_cache(maxsize=64)
+def paginated(item_type):
+    """
+    Return the PaginationResponse parameterization for an item type.
+
+    Each distinct PaginationResponse[T] triggers a full pydantic-core
+    schema build; routing parameterizations through this cache pays that
+    cost once per type instead of once per call site invocation.
+    """
+    return PaginationResponse[item_type]
+
+
 class ErrorResponse(BaseSchema):
     """Schema for error responses."""
     
@@ -129,7 +250,7 @@ class ErrorResponse(BaseSchema):
         description="Human-readable error message",
     )
     
-    details: Optional[Dict[str, Any]] = Field(
+    details: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Additional error details",
     )
@@ -148,7 +269,7 @@ class SuccessResponse(BaseSchema):
         description="Success message",
     )
     
-    data: Optional[Dict[str, Any]] = Field(
+    data: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Additional response data",
     )
@@ -178,14 +299,14 @@ class Address(BaseSchema):
     state: Optional[str] = Field(
         default=None,
         max_length=2,
-        pattern="^[A-Z]{2}$",
+        pattern=STATE_PATTERN,
         description="State abbreviation (e.g., CA, NY)",
     )
     
     zip_code: Optional[str] = Field(
         default=None,
         max_length=10,
-        pattern="^[0-9]{5}(-[0-9]{4})?$",
+        pattern=ZIP_PATTERN,
         description="ZIP code (12345 or 12345-6789)",
     )
     
@@ -208,14 +329,14 @@ class ContactInfo(BaseSchema):
     phone: Optional[str] = Field(
         default=None,
         max_length=20,
-        pattern="^\\+?[1-9]\\d{1,14}$",
+        pattern=PHONE_E164_PATTERN,
         description="Phone number in E.164 format",
     )
     
     secondary_phone: Optional[str] = Field(
         default=None,
         max_length=20,
-        pattern="^\\+?[1-9]\\d{1,14}$",
+        pattern=PHONE_E164_PATTERN,
         description="Secondary phone number",
     )
 
@@ -272,17 +393,17 @@ class RiskAssessment(BaseSchema):
 class Preferences(BaseSchema):
     """Schema for user preferences."""
     
-    communication: Optional[Dict[str, Any]] = Field(
+    communication: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Communication preferences",
     )
-    
-    notifications: Optional[Dict[str, Any]] = Field(
+
+    notifications: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Notification preferences",
     )
-    
-    privacy: Optional[Dict[str, Any]] = Field(
+
+    privacy: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Privacy preferences",
     )
@@ -298,7 +419,7 @@ class SearchParams(BaseSchema):
         description="Search query string",
     )
     
-    filters: Optional[Dict[str, Any]] = Field(
+    filters: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Search filters",
     )
@@ -314,9 +435,18 @@ class SearchParams(BaseSchema):
     )
 
 
+# Compiled once at import: bulk handlers validate their id batch with
+# UUID_LIST_ADAPTER.validate_python(ids) and then model_construct the
+# params, reusing one list-of-uuid validator instead of re-dispatching
+# through the generic list machinery per call.
+UUID_LIST_ADAPTER = TypeAdapter(
+    Annotated[List[UUID], Field(min_length=1, max_length=100)]
+)
+
+
 class BulkOperationParams(BaseSchema):
     """Schema for bulk operation parameters."""
-    
+
     ids: List[UUID] = Field(
         ...,
         min_length=1,
@@ -329,12 +459,26 @@ class BulkOperationParams(BaseSchema):
         description="Operation to perform",
     )
     
-    parameters: Optional[Dict[str, Any]] = Field(
+    parameters: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Additional parameters for the operation",
     )
 
 
+class BulkError(BaseSchema):
+    """Schema for a single bulk operation failure."""
+
+    id: UUID = Field(
+        ...,
+        description="ID of the entity that failed",
+    )
+
+    message: str = Field(
+        ...,
+        description="Why the operation failed for this entity",
+    )
+
+
 class BulkOperationResponse(BaseSchema):
     """Schema for bulk operation responses."""
     
@@ -356,12 +500,12 @@ class BulkOperationResponse(BaseSchema):
         description="Number of failed operations",
     )
     
-    errors: Optional[List[Dict[str, Any]]] = Field(
+    errors: Optional[List[BulkError]] = Field(
         default=None,
         description="List of errors that occurred",
     )
-    
-    results: Optional[List[Any]] = Field(
+
+    results: Optional[List[Dict[str, JSONScalar]]] = Field(
         default=None,
         description="Results of successful operations",
     )
@@ -394,13 +538,33 @@ class FileUpload(BaseSchema):
         description="SHA-256 hash of the file",
     )
 
+    @classmethod
+    def from_stream(cls, fp, filename: str, content_type: str) -> "FileUpload":
+        """Build upload metadata by hashing *fp* without buffering it.
+
+        ``hashlib.file_digest`` streams the file in large chunks at the
+        C level; the size comes from the cursor delta, so the stream is
+        read exactly once. ``model_construct`` skips validation because
+        every field is produced locally and already well-typed.
+        """
+        start = fp.tell()
+        digest = hashlib.file_digest(fp, "sha256")
+        # Seek explicitly: file_digest's fast paths (e.g. BytesIO) hash
+        # the buffer without advancing the cursor.
+        size = fp.seek(0, os.SEEK_END) - start
+        return cls.model_construct(
+            filename=filename,
+            content_type=content_type,
+            size=size,
+            file_hash=digest.hexdigest(),
+        )
+
 
 class ExportParams(BaseSchema):
     """Schema for data export parameters."""
     
-    format: str = Field(
+    format: Literal["csv", "json", "xlsx", "pdf"] = Field(
         ...,
-        pattern="^(csv|json|xlsx|pdf)$",
         description="Export format",
     )
     
@@ -409,7 +573,7 @@ class ExportParams(BaseSchema):
         description="Specific fields to export",
     )
     
-    filters: Optional[Dict[str, Any]] = Field(
+    filters: Optional[Dict[str, JSONScalar]] = Field(
         default=None,
         description="Filters to apply to exported data",
     )
@@ -0,0 +1,102 @@
+"""msgspec Structs for trusted DB-to-HTTP read paths.
+
+These mirror the Pydantic response schemas in `plaintiff.py`/`common.py`
+but validate and encode in C. Use them for data that is already
+guaranteed valid by the database layer; untrusted input
+(`PlaintiffCreate`/`PlaintiffUpdate`) stays on Pydantic.
+"""
+
+from datetime import date, datetime
+from typing import Generic, List, Optional, TypeVar
+from uuid import UUID
+
+import msgspec
+from starlette.responses import Response
+
+from ..database.plaintiff import CaseStatus, CaseType, ContactMethod
+
+T = TypeVar("T")
+
+# One shared encoder: msgspec encoders are cheap but not free to build.
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(Response):
+    """JSON response rendered by msgspec instead of jsonable_encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return _encoder.encode(content)
+
+
+class PlaintiffSummary(msgspec.Struct, frozen=True):
+    """Summary row for plaintiff lists (mirrors schemas.plaintiff.PlaintiffSummary)."""
+
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    case_type: CaseType
+    case_status: CaseStatus
+    created_at: datetime
+    risk_score: Optional[float] = None
+
+
+class PlaintiffResponse(msgspec.Struct, frozen=True):
+    """Full plaintiff read model (mirrors schemas.plaintiff.PlaintiffResponse)."""
+
+    id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    case_type: CaseType
+    case_status: CaseStatus
+    created_at: datetime
+    updated_at: datetime
+    middle_name: Optional[str] = None
+    phone: Optional[str] = None
+    secondary_phone: Optional[str] = None
+    date_of_birth: Optional[date] = None
+    address_line_1: Optional[str] = None
+    address_line_2: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip_code: Optional[str] = None
+    country: Optional[str] = None
+    case_description: Optional[str] = None
+    incident_date: Optional[date] = None
+    law_firm_id: Optional[UUID] = None
+    lawyer_id: Optional[UUID] = None
+    employment_status: Optional[str] = None
+    monthly_income: Optional[float] = None
+    monthly_expenses: Optional[float] = None
+    credit_score: Optional[int] = None
+    bank_account_verified: bool = False
+    risk_score: Optional[float] = None
+    risk_factors: Optional[List[str]] = None
+    preferred_contact_method: ContactMethod = ContactMethod.EMAIL
+    lead_source: Optional[str] = None
+    pipedrive_person_id: Optional[int] = None
+    pipedrive_deal_id: Optional[int] = None
+    full_name: Optional[str] = None
+    full_address: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class PaginationResponse(msgspec.Struct, Generic[T], frozen=True):
+    """Generic paginated envelope (mirrors schemas.common.PaginationResponse)."""
+
+    items: List[T]
+    total: int
+    page: int
+    size: int
+    pages: int
+    has_next: bool
+    has_prev: bool
+
+
+# Pre-built decoders for the common read shapes; msgspec fuses JSON
+# parsing with struct construction so decode+validate is one C pass.
+plaintiff_response_decoder = msgspec.json.Decoder(PlaintiffResponse)
+plaintiff_summary_list_decoder = msgspec.json.Decoder(List[PlaintiffSummary])
@@ -1,23 +1,105 @@
 """Pydantic schemas for Plaintiff entity."""
 
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional, get_args
 from uuid import UUID
 
-from pydantic import Field, EmailStr, validator
+import orjson
+from pydantic import (
+    Field,
+    EmailStr,
+    TypeAdapter,
+    computed_field,
+    model_validator,
+    validator,
+)
 
+from ...config.settings import settings
+from ...utils.text import NON_DIGITS
 from ..database.plaintiff import CaseType, CaseStatus, ContactMethod
 from .common import (
     BaseSchema,
     UUIDMixin,
+    UUIDStrMixin,
     TimestampMixin,
     Address,
     ContactInfo,
     FinancialInfo,
     RiskAssessment,
-    PaginationResponse,
+    paginated,
+    RESPONSE_CONFIG,
+    DATE_PATTERN,
 )
 
+# Runtime imports live in _ensure_response_rebuilt() to break the
+# circular dependency; these satisfy the quoted forward refs statically.
+if TYPE_CHECKING:
+    from .law_firm import LawFirmResponse
+    from .lawyer import LawyerResponse
+
+SSN_PATTERN = r"^\d{3}-\d{2}-\d{4}$"
+
+# Default enum members hoisted once at import: pydantic-core embeds the
+# sentinel instead of resolving the enum attribute per construct, and the
+# non-Optional annotations compile to a plain enum validator rather than
+# a union with None.
+_DEFAULT_CASE_STATUS = CaseStatus.INITIAL
+_DEFAULT_CONTACT_METHOD = ContactMethod.EMAIL
+
+# Legacy flat payload keys, hoisted into the composite sub-models so old
+# clients keep working while pydantic-core shares one compiled validator
+# per sub-model instead of re-dispatching 15+ flat fields.
+_ADDRESS_KEYS = (
+    "address_line_1",
+    "address_line_2",
+    "city",
+    "state",
+    "zip_code",
+    "country",
+)
+_CONTACT_KEYS = ("phone", "secondary_phone")
+_FINANCIAL_KEYS = (
+    "monthly_income",
+    "monthly_expenses",
+    "credit_score",
+    "bank_account_verified",
+)
+
+
+def _hoist_flat_fields(data: Any) -> Any:
+    """Nest legacy flat address/contact/financial keys into sub-model dicts."""
+    if not isinstance(data, dict):
+        return data
+    if not any(
+        key in data
+        for keys in (_ADDRESS_KEYS, _CONTACT_KEYS, _FINANCIAL_KEYS)
+        for key in keys
+    ):
+        return data
+    data = dict(data)
+    for target, keys in (
+        ("address", _ADDRESS_KEYS),
+        ("contact", _CONTACT_KEYS),
+        ("financial", _FINANCIAL_KEYS),
+    ):
+        if data.get(target) is not None:
+            # Nested payload wins; stray flat keys fall through to
+            # extra="forbid" so conflicts surface instead of being dropped.
+            continue
+        nested = {key: data.pop(key) for key in keys if key in data}
+        if nested:
+            data[target] = nested
+    contact = data.get("contact")
+    if isinstance(contact, dict):
+        # Legacy phones arrive formatted; strip to digits so they satisfy
+        # ContactInfo's E.164 pattern.
+        for key in _CONTACT_KEYS:
+            value = contact.get(key)
+            if isinstance(value, str) and not value.startswith("+"):
+                contact[key] = value.translate(NON_DIGITS) or None
+    return data
+
 
 class PlaintiffBase(BaseSchema):
     """Base schema for Plaintiff with common fields."""
@@ -47,74 +129,35 @@ class PlaintiffBase(BaseSchema):
         description="Primary email address",
     )
     
-    phone: Optional[str] = Field(
+    # Composite contact details (shared ContactInfo validator)
+    contact: Optional[ContactInfo] = Field(
         default=None,
-        max_length=20,
-        description="Primary phone number",
+        description="Phone contact details",
     )
-    
-    secondary_phone: Optional[str] = Field(
-        default=None,
-        max_length=20,
-        description="Secondary phone number",
-    )
-    
+
     date_of_birth: Optional[str] = Field(
         default=None,
-        pattern="^\\d{4}-\\d{2}-\\d{2}$",
+        pattern=DATE_PATTERN,
         description="Date of birth in YYYY-MM-DD format",
     )
-    
-    # Address information
-    address_line_1: Optional[str] = Field(
-        default=None,
-        max_length=255,
-        description="Primary address line",
-    )
-    
-    address_line_2: Optional[str] = Field(
-        default=None,
-        max_length=255,
-        description="Secondary address line",
-    )
-    
-    city: Optional[str] = Field(
-        default=None,
-        max_length=100,
-        description="City",
-    )
-    
-    state: Optional[str] = Field(
-        default=None,
-        max_length=2,
-        pattern="^[A-Z]{2}$",
-        description="State abbreviation",
-    )
-    
-    zip_code: Optional[str] = Field(
+
+    # Composite address (shared Address validator)
+    address: Optional[Address] = Field(
         default=None,
-        max_length=10,
-        pattern="^[0-9]{5}(-[0-9]{4})?$",
-        description="ZIP code",
-    )
-    
-    country: Optional[str] = Field(
-        default="USA",
-        max_length=3,
-        description="Country code",
+        description="Mailing address",
     )
-    
+
     # Case information
     case_type: CaseType = Field(
         ...,
         description="Type of legal case",
     )
     
-    case_status: Optional[CaseStatus] = Field(
-        default=CaseStatus.INITIAL,
+    case_status: CaseStatus = Field(
+        default=_DEFAULT_CASE_STATUS,
         description="Current status of the case",
     )
-    
+
     case_description: Optional[str] = Field(
         default=None,
         description="Detailed description of the case",
@@ -122,7 +165,7 @@ class PlaintiffBase(BaseSchema):
     
     incident_date: Optional[str] = Field(
         default=None,
-        pattern="^\\d{4}-\\d{2}-\\d{2}$",
+        pattern=DATE_PATTERN,
         description="Date of the incident in YYYY-MM-DD format",
     )
     
@@ -144,36 +187,18 @@ class PlaintiffBase(BaseSchema):
         description="Current employment status",
     )
     
-    monthly_income: Optional[float] = Field(
+    # Composite financial details (shared FinancialInfo validator)
+    financial: Optional[FinancialInfo] = Field(
         default=None,
-        ge=0,
-        description="Monthly income in USD",
+        description="Financial details",
     )
-    
-    monthly_expenses: Optional[float] = Field(
-        default=None,
-        ge=0,
-        description="Monthly expenses in USD",
-    )
-    
-    credit_score: Optional[int] = Field(
-        default=None,
-        ge=300,
-        le=850,
-        description="Credit score",
-    )
-    
-    bank_account_verified: Optional[bool] = Field(
-        default=False,
-        description="Whether bank account is verified",
-    )
-    
+
     # Communication preferences
-    preferred_contact_method: Optional[ContactMethod] = Field(
-        default=ContactMethod.EMAIL,
+    preferred_contact_method: ContactMethod = Field(
+        default=_DEFAULT_CONTACT_METHOD,
         description="Preferred contact method",
     )
-    
+
     communication_notes: Optional[str] = Field(
         default=None,
         description="Special communication instructions",
@@ -196,22 +221,29 @@ class PlaintiffBase(BaseSchema):
         description="General notes",
     )
     
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_flat_payloads(cls, data: Any) -> Any:
+        """Hoist legacy flat address/contact/financial keys into sub-models."""
+        data = _hoist_flat_fields(data)
+        if isinstance(data, dict) and (
+            data.get("case_status", ...) is None
+            or data.get("preferred_contact_method", ...) is None
+        ):
+            # Legacy clients send explicit nulls for the defaulted enums;
+            # drop them so the non-Optional defaults still apply.
+            data = dict(data)
+            for key in ("case_status", "preferred_contact_method"):
+                if data.get(key, ...) is None:
+                    del data[key]
+        return data
+
     @validator("email")
-    def validate_email(cls, v):
+    def validate_email(cls, v: Optional[str]) -> Optional[str]:
         """Validate email format."""
         if v:
             v = v.lower().strip()
         return v
-    
-    @validator("phone", "secondary_phone")
-    def validate_phone(cls, v):
-        """Validate phone number format."""
-        if v:
-            # Remove non-digit characters for validation
-            digits_only = "".join(filter(str.isdigit, v))
-            if len(digits_only) < 10:
-                raise ValueError("Phone number must have at least 10 digits")
-        return v
 
 
 class PlaintiffCreate(PlaintiffBase):
@@ -226,7 +258,7 @@ class PlaintiffCreate(PlaintiffBase):
     # SSN only for creation (encrypted storage)
     social_security_number: Optional[str] = Field(
         default=None,
-        pattern="^\\d{3}-\\d{2}-\\d{4}$",
+        pattern=SSN_PATTERN,
         description="Social Security Number in XXX-XX-XXXX format",
     )
 
@@ -259,57 +291,23 @@ class PlaintiffUpdate(BaseSchema):
         description="Primary email address",
     )
     
-    phone: Optional[str] = Field(
-        default=None,
-        max_length=20,
-        description="Primary phone number",
-    )
-    
-    secondary_phone: Optional[str] = Field(
+    contact: Optional[ContactInfo] = Field(
         default=None,
-        max_length=20,
-        description="Secondary phone number",
+        description="Phone contact details",
     )
-    
+
     date_of_birth: Optional[str] = Field(
         default=None,
-        pattern="^\\d{4}-\\d{2}-\\d{2}$",
+        pattern=DATE_PATTERN,
         description="Date of birth in YYYY-MM-DD format",
     )
-    
+
     # Address fields
-    address_line_1: Optional[str] = Field(
+    address: Optional[Address] = Field(
         default=None,
-        max_length=255,
-        description="Primary address line",
+        description="Mailing address",
     )
-    
-    address_line_2: Optional[str] = Field(
-        default=None,
-        max_length=255,
-        description="Secondary address line",
-    )
-    
-    city: Optional[str] = Field(
-        default=None,
-        max_length=100,
-        description="City",
-    )
-    
-    state: Optional[str] = Field(
-        default=None,
-        max_length=2,
-        pattern="^[A-Z]{2}$",
-        description="State abbreviation",
-    )
-    
-    zip_code: Optional[str] = Field(
-        default=None,
-        max_length=10,
-        pattern="^[0-9]{5}(-[0-9]{4})?$",
-        description="ZIP code",
-    )
-    
+
     case_type: Optional[CaseType] = Field(
         default=None,
         description="Type of legal case",
@@ -327,7 +325,7 @@ class PlaintiffUpdate(BaseSchema):
     
     incident_date: Optional[str] = Field(
         default=None,
-        pattern="^\\d{4}-\\d{2}-\\d{2}$",
+        pattern=DATE_PATTERN,
         description="Date of the incident",
     )
     
@@ -347,30 +345,11 @@ class PlaintiffUpdate(BaseSchema):
         description="Current employment status",
     )
     
-    monthly_income: Optional[float] = Field(
-        default=None,
-        ge=0,
-        description="Monthly income in USD",
-    )
-    
-    monthly_expenses: Optional[float] = Field(
+    financial: Optional[FinancialInfo] = Field(
         default=None,
-        ge=0,
-        description="Monthly expenses in USD",
+        description="Financial details",
     )
-    
-    credit_score: Optional[int] = Field(
-        default=None,
-        ge=300,
-        le=850,
-        description="Credit score",
-    )
-    
-    bank_account_verified: Optional[bool] = Field(
-        default=None,
-        description="Whether bank account is verified",
-    )
-    
+
     preferred_contact_method: Optional[ContactMethod] = Field(
         default=None,
         description="Preferred contact method",
@@ -391,21 +370,52 @@ class PlaintiffUpdate(BaseSchema):
         description="General notes",
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_flat_payloads(cls, data: Any) -> Any:
+        """Hoist legacy flat address/contact/financial keys into sub-models."""
+        return _hoist_flat_fields(data)
+
+
+# One compiled adapter per updatable field (constraints included via the
+# FieldInfo metadata). A PATCH touching one field then runs one validator
+# instead of dispatching through the whole PlaintiffUpdate schema.
+UPDATE_FIELD_ADAPTERS: Dict[str, TypeAdapter] = {
+    name: TypeAdapter(Annotated[field.annotation, field])
+    for name, field in PlaintiffUpdate.model_fields.items()
+}
+
+
+def validate_update(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a partial plaintiff update field-by-field.
+
+    Legacy flat address/contact/financial keys are hoisted first, then
+    only the fields present in the payload hit their adapter. Unknown
+    keys raise ValueError, mirroring extra="forbid".
+    """
+    payload = _hoist_flat_fields(payload)
+    validated: Dict[str, Any] = {}
+    for key, value in payload.items():
+        adapter = UPDATE_FIELD_ADAPTERS.get(key)
+        if adapter is None:
+            raise ValueError(f"Unknown plaintiff field: {key}")
+        validated[key] = adapter.validate_python(value)
+    return validated
+
 
 class PlaintiffResponse(PlaintiffBase, UUIDMixin, TimestampMixin):
     """Schema for plaintiff responses."""
-    
-    # Computed fields
-    full_name: Optional[str] = Field(
-        default=None,
-        description="Full name of the plaintiff",
-    )
-    
-    full_address: Optional[str] = Field(
-        default=None,
-        description="Full formatted address",
+
+    model_config = RESPONSE_CONFIG
+
+    # Persisted emails were validated at create time; plain str skips
+    # the email-validator pass on every response row.
+    email: str = Field(
+        ...,
+        description="Primary email address",
     )
-    
+
     # Risk assessment
     risk_score: Optional[float] = Field(
         default=None,
@@ -441,22 +451,145 @@ class PlaintiffResponse(PlaintiffBase, UUIDMixin, TimestampMixin):
         description="Primary lawyer details",
     )
 
+    # Computed lazily at serialization time (and cached per instance)
+    # instead of being concatenated by the caller for every row.
+    @computed_field
+    @cached_property
+    def full_name(self) -> str:
+        """Full name of the plaintiff."""
+        parts = (self.first_name, self.middle_name, self.last_name)
+        return " ".join(p for p in parts if p)
 
-class PlaintiffSummary(UUIDMixin):
+    @computed_field
+    @cached_property
+    def full_address(self) -> str:
+        """Full formatted address."""
+        address = self.address
+        if address is None or not address.address_line_1:
+            return ""
+        parts = [address.address_line_1]
+        if address.address_line_2:
+            parts.append(address.address_line_2)
+        if address.city and address.state:
+            parts.append(f"{address.city}, {address.state}")
+        if address.zip_code:
+            parts.append(address.zip_code)
+        return ", ".join(parts)
+
+    @classmethod
+    def from_orm_fast(cls, row) -> "PlaintiffResponse":
+        """
+        Hydrate from a trusted DB row without re-running validation.
+
+        The database layer already enforces these constraints, so
+        model_construct skips EmailStr/regex/enum re-checks. Falls back
+        to model_validate when settings.trust_db_payloads is off.
+        """
+        _ensure_response_rebuilt()
+        if not settings.trust_db_payloads:
+            return cls.model_validate(row)
+        source = _source_of(row)
+        data = {k: v for k, v in source.items() if k in cls.model_fields}
+        # ORM rows carry the flat columns; assemble the composite
+        # sub-models from them without re-validating.
+        for target, keys, sub_cls in (
+            ("address", _ADDRESS_KEYS, Address),
+            ("contact", _CONTACT_KEYS, ContactInfo),
+            ("financial", _FINANCIAL_KEYS, FinancialInfo),
+        ):
+            if data.get(target) is None:
+                nested = {key: source[key] for key in keys if key in source}
+                if nested:
+                    data[target] = sub_cls.model_construct(**nested)
+        # model_construct does not recurse, so build nested responses
+        # from their own annotations before constructing the outer model.
+        for key in ("law_firm", "lawyer"):
+            nested = data.get(key)
+            if nested is not None and not isinstance(nested, BaseSchema):
+                nested_cls = next(
+                    t for t in get_args(cls.model_fields[key].annotation)
+                    if t is not type(None)
+                )
+                data[key] = nested_cls.model_construct(
+                    **_row_to_dict(nested, nested_cls)
+                )
+        return cls.model_construct(**data)
+
+
+class PlaintiffSummary(UUIDStrMixin):
     """Summary schema for plaintiff lists."""
-    
+
+    model_config = RESPONSE_CONFIG
+
     first_name: str = Field(..., description="First name")
     last_name: str = Field(..., description="Last name")
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., description="Email address")
     case_type: CaseType = Field(..., description="Case type")
     case_status: CaseStatus = Field(..., description="Case status")
     risk_score: Optional[float] = Field(default=None, description="Risk score")
     created_at: datetime = Field(..., description="Creation timestamp")
 
+    @classmethod
+    def from_orm_fast(cls, row) -> "PlaintiffSummary":
+        """Hydrate a list row from trusted DB data without validation."""
+        data = _row_to_dict(row, cls)
+        entity_id = data.get("id")
+        if entity_id is not None and not isinstance(entity_id, str):
+            data["id"] = str(entity_id)
+        if not settings.trust_db_payloads:
+            return cls.model_validate(data)
+        return cls.model_construct(**data)
+
 
-class PlaintiffList(PaginationResponse[PlaintiffSummary]):
-    """Schema for paginated plaintiff lists."""
-    pass
+def _source_of(row) -> dict:
+    """Return the raw mapping behind a Row, dict, or ORM instance."""
+    if hasattr(row, "_asdict"):
+        return row._asdict()
+    if isinstance(row, dict):
+        return row
+    return vars(row)
+
+
+def _row_to_dict(row, schema_cls) -> dict:
+    """Extract the schema's fields from a Row, mapping, or ORM instance."""
+    fields = schema_cls.model_fields
+    return {k: v for k, v in _source_of(row).items() if k in fields}
+
+
+# Paginated plaintiff list, parameterized once through the cached
+# factory rather than re-triggering a generic schema build per call site.
+PlaintiffList = paginated(PlaintiffSummary)
+
+
+# One compiled list-of-model validator/serializer, built at import and
+# reused for every page instead of a fresh generic schema per request.
+# Dump a whole batch with PLAINTIFF_LIST_DUMP(rows, mode="json") rather
+# than calling model_dump() per row.
+PLAINTIFF_LIST_ADAPTER = TypeAdapter(List[PlaintiffSummary])
+PLAINTIFF_LIST_DUMP = PLAINTIFF_LIST_ADAPTER.dump_python
+
+
+def dump_page(items: List[PlaintiffSummary], total: int, page: int, size: int) -> bytes:
+    """
+    Serialize a summary page straight to JSON bytes.
+
+    The item list is dumped once by pydantic-core and spliced into an
+    orjson-encoded envelope, skipping the intermediate
+    PaginationResponse model and its per-field re-walk of every row.
+    """
+    pages = (total + size - 1) // size if size else 0
+    envelope = orjson.dumps(
+        {
+            "size": size,
+            "total": total,
+            "page": page,
+            "pages": pages,
+            "has_next": page < pages,
+            "has_prev": page > 1,
+        }
+    )
+    items_bytes = PLAINTIFF_LIST_ADAPTER.dump_json(items)
+    return b'{"items":' + items_bytes + b"," + envelope[1:]
 
 
 class PlaintiffSearch(BaseSchema):
@@ -525,17 +658,17 @@ class PlaintiffStats(BaseSchema):
     
     total_count: int = Field(..., description="Total number of plaintiffs")
     
-    by_status: dict = Field(
+    by_status: Dict[CaseStatus, int] = Field(
         ...,
         description="Count by case status",
     )
-    
-    by_case_type: dict = Field(
+
+    by_case_type: Dict[CaseType, int] = Field(
         ...,
         description="Count by case type",
     )
-    
-    by_state: dict = Field(
+
+    by_state: Dict[str, int] = Field(
         ...,
         description="Count by state",
     )
@@ -556,9 +689,28 @@ class PlaintiffStats(BaseSchema):
     )
 
 
-# Forward references for relationship models
-from .law_firm import LawFirmResponse  # noqa: E402
-from .lawyer import LawyerResponse  # noqa: E402
+_RESPONSE_REBUILT = False
 
-# Update forward references
-PlaintiffResponse.model_rebuild()
\ No newline at end of file
+
+def _ensure_response_rebuilt() -> None:
+    """
+    Resolve PlaintiffResponse's law_firm/lawyer forward refs on first use.
+
+    Importing the nested response modules and regenerating the
+    pydantic-core schema eagerly at import time added a full
+    model_rebuild to every cold start; deferring it means processes that
+    never touch PlaintiffResponse skip the cost entirely.
+    """
+    global _RESPONSE_REBUILT
+    if _RESPONSE_REBUILT:
+        return
+    from .law_firm import LawFirmResponse  # noqa: F401
+    from .lawyer import LawyerResponse  # noqa: F401
+
+    PlaintiffResponse.model_rebuild(
+        _types_namespace={
+            "LawFirmResponse": LawFirmResponse,
+            "LawyerResponse": LawyerResponse,
+        }
+    )
+    _RESPONSE_REBUILT = True
\ No newline at end of file
@@ -1,9 +1,32 @@
 """OpenAI API client service."""
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import collections
+import hashlib
+import io
+import importlib.util
+import time
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Sequence
+import httpx
 import openai
+import orjson
 from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 from ...config.settings import get_settings
 from ...utils.logging import get_logger
 
@@ -15,17 +38,361 @@ class OpenAIError(Exception):
     """Custom exception for OpenAI API errors."""
     pass
 
+
+# Terminal batch states per the OpenAI Batch API lifecycle.
+_BATCH_DONE_STATES = ("completed", "failed", "expired", "cancelled")
+
+# Document truncation budget. The context window is conservative for the
+# default gpt-3.5-turbo family; the overhead covers message framing and
+# the user-template scaffolding around the document text.
+_MODEL_CONTEXT_WINDOW = 16385
+_PROMPT_OVERHEAD_TOKENS = 64
+
+
+# Prompt templates, built once at import. The instructions live in the
+# system message so its bytes are identical across calls (enabling
+# server-side prefix caching where supported); the user message carries
+# only the varying fields.
+_DOC_ANALYSIS_SYSTEM = (
+    "You are an expert legal document analyzer. For each document provide: "
+    "1. Document classification. "
+    "2. Key entities (names, dates, amounts, addresses). "
+    "3. Summary of main points. "
+    "4. Confidence score (0-100). "
+    "5. Any legal or medical terms identified."
+)
+_DOC_ANALYSIS_USER_TMPL = "Analyze this {document_type} document:\n{text}"
+
+_RISK_ASSESSMENT_SYSTEM = (
+    "You are an expert risk analyst for pre-settlement funding cases. "
+    "Provide a comprehensive risk assessment covering: "
+    "1. Overall risk score (0-100, where 100 is lowest risk). "
+    "2. Financial risk factors. "
+    "3. Legal risk factors. "
+    "4. Medical risk factors. "
+    "5. Behavioral risk factors. "
+    "6. Specific concerns or red flags. "
+    "7. Recommendations."
+)
+_RISK_ASSESSMENT_USER_TMPL = (
+    "Case Information:\n"
+    "- Case Type: {case_type}\n"
+    "- Incident Date: {incident_date}\n"
+    "- Description: {description}\n"
+    "- Medical Treatment: {medical_treatment}\n"
+    "- Insurance Coverage: {insurance_coverage}\n"
+    "- Prior Claims: {prior_claims}\n"
+    "- Employment Status: {employment_status}"
+)
+
+_EMAIL_SYSTEM = (
+    "You are a professional legal communication specialist. Generate a "
+    "professional email with a subject line and body that is professional "
+    "and empathetic, clear and concise, legally appropriate, and "
+    "personalized to the context."
+)
+_EMAIL_USER_TMPL = (
+    "Generate an email for {template_type} communication.\n"
+    "Context:\n"
+    "- Recipient Name: {recipient_name}\n"
+    "- Case Type: {case_type}\n"
+    "- Company: {company_name}"
+)
+
+_CASE_BUNDLE_SYSTEM = (
+    "You are an expert legal analyst for pre-settlement funding cases. "
+    "For each case respond with three sections: "
+    "'analysis' - classify the attached document, extract key entities "
+    "(names, dates, amounts, addresses), summarize the main points, give "
+    "a 0-100 confidence score, and list legal or medical terms; "
+    "'risk' - a comprehensive risk assessment with an overall score "
+    "(0-100, where 100 is lowest risk), financial, legal, medical and "
+    "behavioral risk factors, specific red flags, and recommendations; "
+    "'communication' - a professional, empathetic, legally appropriate "
+    "client email with subject and body personalized to the context."
+)
+_CASE_BUNDLE_USER_TMPL = (
+    "Document:\n{text}\n\n"
+    + _RISK_ASSESSMENT_USER_TMPL
+    + "\n\nCommunication Context:\n"
+    "- Recipient Name: {recipient_name}\n"
+    "- Company: {company_name}"
+)
+
+_SMS_SYSTEM = (
+    "You are a professional legal communication specialist. Generate a "
+    "brief SMS message that is under 160 characters, professional but "
+    "friendly, TCPA compliant, with a clear call to action if needed."
+)
+_SMS_USER_TMPL = (
+    "Generate an SMS for {template_type} communication.\n"
+    "Context:\n"
+    "- Recipient Name: {recipient_name}\n"
+    "- Case Type: {case_type}"
+)
+
+
+class _StrictSchema(BaseModel):
+    """Base for structured-output models (strict mode needs closed objects)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class DocumentEntity(_StrictSchema):
+    text: str
+    type: str
+    confidence: float
+
+
+class DocumentAnalysis(_StrictSchema):
+    """Structured output schema for document analysis."""
+
+    classification: str
+    entities: List[DocumentEntity]
+    summary: str
+    confidence_score: int
+    legal_terms: List[str]
+    medical_terms: List[str]
+
+
+class RiskFactor(_StrictSchema):
+    factor: str
+    severity: str
+    description: str
+
+
+class RiskAssessment(_StrictSchema):
+    """Structured output schema for case risk assessment."""
+
+    overall_score: int
+    financial_risk: int
+    legal_risk: int
+    medical_risk: int
+    behavioral_risk: int
+    risk_factors: List[RiskFactor]
+    red_flags: List[str]
+    recommendations: List[str]
+    confidence: int
+
+
+class CommunicationContent(_StrictSchema):
+    """Structured output schema for generated email content."""
+
+    subject: str
+    content: str
+
+
+class SMSContent(_StrictSchema):
+    """Structured output schema for generated SMS content."""
+
+    content: str
+
+
+class CaseAnalysisBundle(_StrictSchema):
+    """Structured output schema for the fused per-case analysis."""
+
+    analysis: DocumentAnalysis
+    risk: RiskAssessment
+    communication: CommunicationContent
+
+
+def _json_schema_format(name: str, model: type) -> Dict[str, Any]:
+    """Build a response_format payload for OpenAI structured outputs."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "schema": model.model_json_schema(),
+            "strict": True,
+        },
+    }
+
+
+# Precomputed once: model_json_schema walks the model tree on every call.
+_DOCUMENT_ANALYSIS_FORMAT = _json_schema_format("document_analysis", DocumentAnalysis)
+_RISK_ASSESSMENT_FORMAT = _json_schema_format("risk_assessment", RiskAssessment)
+_EMAIL_CONTENT_FORMAT = _json_schema_format("email_content", CommunicationContent)
+_SMS_CONTENT_FORMAT = _json_schema_format("sms_content", SMSContent)
+_CASE_BUNDLE_FORMAT = _json_schema_format("case_analysis_bundle", CaseAnalysisBundle)
+
+
+def _cache_key(*parts: str) -> str:
+    """Content hash for cached analyses.
+
+    blake2b is the fastest keyed hash in the stdlib for the 1-10 KB
+    strings hashed here; blake3 would be faster still but is not a
+    project dependency.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class _MemoryCache:
+    """Minimal TTL key-value store used when diskcache is not installed."""
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + expire if expire else None
+        self._data[key] = (value, expires_at)
+
+
+class ConcurrentLimiter:
+    """Token-aware concurrency limiter for OpenAI request fan-out.
+
+    A semaphore caps in-flight requests while sliding one-minute request
+    and token windows keep bursts under the account's RPM/TPM ceilings,
+    following the openai-cookbook parallel-processor pattern. Token
+    usage is charged from the actual ``response.usage`` figures via
+    ``record``.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_requests_per_minute: int,
+        max_tokens_per_minute: int,
+    ):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._requests: collections.deque = collections.deque()
+        self._token_events: collections.deque = collections.deque()
+        self._token_total = 0
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - 60.0
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._token_events and self._token_events[0][0] <= cutoff:
+            self._token_total -= self._token_events.popleft()[1]
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and per-minute headroom."""
+        await self._semaphore.acquire()
+        while True:
+            async with self._lock:
+                now = asyncio.get_running_loop().time()
+                self._prune(now)
+                if (
+                    len(self._requests) < self.max_requests_per_minute
+                    and self._token_total < self.max_tokens_per_minute
+                ):
+                    self._requests.append(now)
+                    return
+                oldest = self._requests[0] if self._requests else now
+                wait_time = max(oldest + 60.0 - now, 0.1)
+            await asyncio.sleep(wait_time)
+
+    def release(self) -> None:
+        """Release the concurrency slot."""
+        self._semaphore.release()
+
+    def record(self, tokens: Optional[int]) -> None:
+        """Charge actual token usage reported by a response."""
+        if not tokens:
+            return
+        self._token_events.append((asyncio.get_running_loop().time(), tokens))
+        self._token_total += tokens
+
+
+def _document_fallback(response: str) -> Dict[str, Any]:
+    """Fallback document analysis when the model response is not valid JSON."""
+    return {
+        "classification": "unknown",
+        "entities": [],
+        "summary": response[:200] + "..." if len(response) > 200 else response,
+        "confidence_score": 50,
+        "legal_terms": [],
+        "medical_terms": []
+    }
+
+
+def _risk_fallback() -> Dict[str, Any]:
+    """Fallback risk assessment when the model response is not valid JSON."""
+    return {
+        "overall_score": 50,
+        "financial_risk": 50,
+        "legal_risk": 50,
+        "medical_risk": 50,
+        "behavioral_risk": 50,
+        "risk_factors": [],
+        "red_flags": [],
+        "recommendations": [],
+        "confidence": 30
+    }
+
 class OpenAIClient:
     """OpenAI API client with async support and error handling."""
     
     def __init__(self):
+        # Persistent keep-alive pool (HTTP/2 when h2 is installed): the
+        # default transport renegotiates TLS far more often under the
+        # many-call analysis workloads, costing ~100-300ms per fresh
+        # connection.
+        http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=60,
+            ),
+        )
         self.client = AsyncOpenAI(
             api_key=settings.OPENAI_API_KEY,
             timeout=30.0,
-            max_retries=3
+            max_retries=3,
+            http_client=http_client
         )
         self.default_model = settings.OPENAI_MODEL
         self.max_tokens = settings.OPENAI_MAX_TOKENS
+        # int() so the limiter accepts any int-coercible settings object
+        # (tests patch the settings module with mocks).
+        self.limiter = ConcurrentLimiter(
+            max_concurrent=int(settings.ai.openai_max_concurrency),
+            max_requests_per_minute=int(settings.ai.openai_requests_per_minute),
+            max_tokens_per_minute=int(settings.ai.openai_tokens_per_minute),
+        )
+        # Token-exact document truncation (tiktoken's core is Rust, so
+        # encoding a 20KB document is sub-ms). Character fallback when
+        # tiktoken is not installed.
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.default_model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+            system_tokens = len(self._encoding.encode(_DOC_ANALYSIS_SYSTEM))
+            self._doc_token_budget = max(
+                512,
+                _MODEL_CONTEXT_WINDOW
+                - self.max_tokens
+                - system_tokens
+                - _PROMPT_OVERHEAD_TOKENS,
+            )
+        else:
+            self._encoding = None
+        # Content-addressed result cache: identical documents/cases hit
+        # a local lookup instead of a 1-3s network round trip.
+        if diskcache is not None:
+            self._cache = diskcache.Cache(settings.ai.openai_cache_dir)
+        else:
+            self._cache = _MemoryCache()
+        self._cache_ttl = settings.ai.openai_cache_ttl
     
     async def chat_completion(
         self,
@@ -33,12 +400,15 @@ class OpenAIClient:
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: float = 0.3,
+        response_format: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> str:
         """Generate chat completion with error handling."""
         try:
             model = model or self.default_model
             max_tokens = max_tokens or self.max_tokens
+            if response_format is not None:
+                kwargs["response_format"] = response_format
             
             response = await self.client.chat.completions.create(
                 model=model,
@@ -49,10 +419,12 @@ class OpenAIClient:
             )
             
             content = response.choices[0].message.content
+            tokens_used = response.usage.total_tokens if response.usage else None
+            self.limiter.record(tokens_used)
             logger.info(
                 "OpenAI chat completion successful",
                 model=model,
-                tokens_used=response.usage.total_tokens if response.usage else None
+                tokens_used=tokens_used
             )
             return content
             
@@ -66,127 +438,170 @@ class OpenAIClient:
             logger.error(f"OpenAI chat completion failed: {e}")
             raise
     
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.3,
+        response_format: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        """Stream chat completion content deltas as they arrive.
+
+        Callers process output while the model is still generating
+        instead of idling for the full completion. Pair with
+        ``response_format={"type": "json_object"}`` so partial content
+        is always a structurally valid JSON prefix.
+        """
+        try:
+            model = model or self.default_model
+            max_tokens = max_tokens or self.max_tokens
+            if response_format is not None:
+                kwargs["response_format"] = response_format
+
+            stream = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                **kwargs
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except openai.RateLimitError as e:
+            logger.error(f"OpenAI rate limit exceeded: {e}")
+            raise
+        except openai.AuthenticationError as e:
+            logger.error(f"OpenAI authentication failed: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"OpenAI streaming completion failed: {e}")
+            raise
+
+    async def stream_json_events(self, messages: List[Dict[str, str]], **kwargs):
+        """Yield ``(path, event, value)`` JSON parse events while streaming.
+
+        Structural fields (e.g. ``confidence_score``) become available
+        before long string fields finish generating, so consumers can
+        break out as soon as they have what they need. Requires the
+        optional ijson dependency.
+        """
+        if ijson is None:
+            raise OpenAIError("ijson is required for incremental JSON streaming")
+
+        kwargs.setdefault("response_format", {"type": "json_object"})
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events)
+        async for delta in self.chat_completion_stream(messages, **kwargs):
+            parser.send(delta.encode("utf-8"))
+            while events:
+                yield events.pop(0)
+        try:
+            parser.close()
+        except StopIteration:  # pragma: no cover - generator already done
+            pass
+        while events:
+            yield events.pop(0)
+
+    def _truncate_document(self, text: str) -> str:
+        """Trim a document to the model's exact token budget."""
+        if self._encoding is None:
+            return text[:4000]  # Rough character heuristic
+        tokens = self._encoding.encode(text)
+        if len(tokens) <= self._doc_token_budget:
+            return text
+        return self._encoding.decode(tokens[:self._doc_token_budget])
+
+    def _document_messages(self, text: str, document_type: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a document analysis request."""
+        return [
+            {"role": "system", "content": _DOC_ANALYSIS_SYSTEM},
+            {"role": "user", "content": _DOC_ANALYSIS_USER_TMPL.format(
+                document_type=document_type,
+                text=self._truncate_document(text),
+            )}
+        ]
+
     async def analyze_document(self, text: str, document_type: str = "legal") -> Dict[str, Any]:
         """Analyze document content using AI."""
         try:
-            prompt = f"""
-            Analyze the following {document_type} document and extract key information:
-            
-            Document Text:
-            {text[:4000]}  # Limit to avoid token limits
-            
-            Please provide:
-            1. Document classification
-            2. Key entities (names, dates, amounts, addresses)
-            3. Summary of main points
-            4. Confidence score (0-100)
-            5. Any legal or medical terms identified
-            
-            Respond in JSON format with the following structure:
-            {{
-                "classification": "document type",
-                "entities": [
-                    {{"text": "entity", "type": "person|date|money|location|organization", "confidence": 0.95}}
-                ],
-                "summary": "brief summary",
-                "confidence_score": 85,
-                "legal_terms": ["term1", "term2"],
-                "medical_terms": ["term1", "term2"]
-            }}
-            """
-            
-            messages = [
-                {"role": "system", "content": "You are an expert legal document analyzer."},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = await self.chat_completion(messages, temperature=0.1)
-            
-            # Parse JSON response
-            import json
+            truncated = self._truncate_document(text)
+            key = _cache_key(self.default_model, document_type, truncated)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+            messages = self._document_messages(truncated, document_type)
+
+            response = await self.chat_completion(
+                messages,
+                temperature=0.1,
+                response_format=_DOCUMENT_ANALYSIS_FORMAT,
+            )
+
+            # Structured outputs guarantee schema-valid JSON; the fallback
+            # only covers truncated responses and older models.
             try:
-                result = json.loads(response)
+                result = DocumentAnalysis.model_validate_json(response).model_dump()
+                self._cache.set(key, result, expire=self._cache_ttl)
                 return result
-            except json.JSONDecodeError:
+            except ValidationError:
                 logger.warning("Failed to parse JSON response from OpenAI")
-                return {
-                    "classification": "unknown",
-                    "entities": [],
-                    "summary": response[:200] + "..." if len(response) > 200 else response,
-                    "confidence_score": 50,
-                    "legal_terms": [],
-                    "medical_terms": []
-                }
-                
+                return _document_fallback(response)
+
         except Exception as e:
             logger.error(f"Document analysis failed: {e}")
             raise
-    
+
+    def _risk_messages(self, case_data: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Build the chat messages for a case risk assessment request."""
+        prompt = _RISK_ASSESSMENT_USER_TMPL.format(
+            case_type=case_data.get('case_type', 'Unknown'),
+            incident_date=case_data.get('incident_date', 'Unknown'),
+            description=case_data.get('description', 'No description'),
+            medical_treatment=case_data.get('medical_treatment', 'Unknown'),
+            insurance_coverage=case_data.get('insurance_coverage', 'Unknown'),
+            prior_claims=case_data.get('prior_claims', 'Unknown'),
+            employment_status=case_data.get('employment_status', 'Unknown'),
+        )
+        return [
+            {"role": "system", "content": _RISK_ASSESSMENT_SYSTEM},
+            {"role": "user", "content": prompt}
+        ]
+
     async def assess_case_risk(self, case_data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess risk for a legal case using AI."""
         try:
-            prompt = f"""
-            Analyze the following legal case data and provide a comprehensive risk assessment:
-            
-            Case Information:
-            - Case Type: {case_data.get('case_type', 'Unknown')}
-            - Incident Date: {case_data.get('incident_date', 'Unknown')}
-            - Description: {case_data.get('description', 'No description')}
-            - Medical Treatment: {case_data.get('medical_treatment', 'Unknown')}
-            - Insurance Coverage: {case_data.get('insurance_coverage', 'Unknown')}
-            - Prior Claims: {case_data.get('prior_claims', 'Unknown')}
-            - Employment Status: {case_data.get('employment_status', 'Unknown')}
-            
-            Provide risk assessment covering:
-            1. Overall risk score (0-100, where 100 is lowest risk)
-            2. Financial risk factors
-            3. Legal risk factors
-            4. Medical risk factors
-            5. Behavioral risk factors
-            6. Specific concerns or red flags
-            7. Recommendations
-            
-            Respond in JSON format:
-            {{
-                "overall_score": 75,
-                "financial_risk": 85,
-                "legal_risk": 70,
-                "medical_risk": 80,
-                "behavioral_risk": 90,
-                "risk_factors": [
-                    {{"factor": "factor name", "severity": "low|medium|high", "description": "explanation"}}
-                ],
-                "red_flags": ["flag1", "flag2"],
-                "recommendations": ["rec1", "rec2"],
-                "confidence": 85
-            }}
-            """
-            
-            messages = [
-                {"role": "system", "content": "You are an expert risk analyst for pre-settlement funding cases."},
-                {"role": "user", "content": prompt}
-            ]
-            
-            response = await self.chat_completion(messages, temperature=0.2)
-            
-            import json
+            key = _cache_key(
+                self.default_model,
+                orjson.dumps(
+                    case_data, option=orjson.OPT_SORT_KEYS, default=str
+                ).decode(),
+            )
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+            messages = self._risk_messages(case_data)
+
+            response = await self.chat_completion(
+                messages,
+                temperature=0.2,
+                response_format=_RISK_ASSESSMENT_FORMAT,
+            )
+
             try:
-                result = json.loads(response)
+                result = RiskAssessment.model_validate_json(response).model_dump()
+                self._cache.set(key, result, expire=self._cache_ttl)
                 return result
-            except json.JSONDecodeError:
+            except ValidationError:
                 logger.warning("Failed to parse risk assessment JSON response")
-                return {
-                    "overall_score": 50,
-                    "financial_risk": 50,
-                    "legal_risk": 50,
-                    "medical_risk": 50,
-                    "behavioral_risk": 50,
-                    "risk_factors": [],
-                    "red_flags": [],
-                    "recommendations": [],
-                    "confidence": 30
-                }
-                
+                return _risk_fallback()
+
         except Exception as e:
             logger.error(f"Risk assessment failed: {e}")
             raise
@@ -200,58 +615,39 @@ class OpenAIClient:
         """Generate personalized communication content."""
         try:
             if communication_type == "email":
-                prompt = f"""
-                Generate a professional email for {template_type} communication.
-                
-                Context:
-                - Recipient Name: {context.get('recipient_name', 'Client')}
-                - Case Type: {context.get('case_type', 'legal matter')}
-                - Company: {context.get('company_name', 'Legal Funding Company')}
-                
-                Generate subject line and body that is:
-                - Professional and empathetic
-                - Clear and concise
-                - Legally appropriate
-                - Personalized to the context
-                
-                Respond in JSON format:
-                {{
-                    "subject": "Email subject line",
-                    "content": "Email body content"
-                }}
-                """
+                system = _EMAIL_SYSTEM
+                prompt = _EMAIL_USER_TMPL.format(
+                    template_type=template_type,
+                    recipient_name=context.get('recipient_name', 'Client'),
+                    case_type=context.get('case_type', 'legal matter'),
+                    company_name=context.get('company_name', 'Legal Funding Company'),
+                )
+                response_format = _EMAIL_CONTENT_FORMAT
+                content_model = CommunicationContent
             else:  # SMS
-                prompt = f"""
-                Generate a brief SMS message for {template_type} communication.
-                
-                Context:
-                - Recipient Name: {context.get('recipient_name', 'Client')}
-                - Case Type: {context.get('case_type', 'legal matter')}
-                
-                Generate SMS content that is:
-                - Under 160 characters
-                - Professional but friendly
-                - Clear call to action if needed
-                - TCPA compliant
-                
-                Respond in JSON format:
-                {{
-                    "content": "SMS message content"
-                }}
-                """
-            
+                system = _SMS_SYSTEM
+                prompt = _SMS_USER_TMPL.format(
+                    template_type=template_type,
+                    recipient_name=context.get('recipient_name', 'Client'),
+                    case_type=context.get('case_type', 'legal matter'),
+                )
+                response_format = _SMS_CONTENT_FORMAT
+                content_model = SMSContent
+
             messages = [
-                {"role": "system", "content": "You are a professional legal communication specialist."},
+                {"role": "system", "content": system},
                 {"role": "user", "content": prompt}
             ]
             
-            response = await self.chat_completion(messages, temperature=0.4)
-            
-            import json
+            response = await self.chat_completion(
+                messages,
+                temperature=0.4,
+                response_format=response_format,
+            )
+
             try:
-                result = json.loads(response)
-                return result
-            except json.JSONDecodeError:
+                return content_model.model_validate_json(response).model_dump()
+            except ValidationError:
                 logger.warning("Failed to parse communication content JSON response")
                 if communication_type == "email":
                     return {
@@ -267,6 +663,259 @@ class OpenAIClient:
             logger.error(f"Communication content generation failed: {e}")
             raise
 
+    async def analyze_case_full(
+        self,
+        text: str,
+        case_data: Dict[str, Any],
+        comm_context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Run document analysis, risk assessment, and client email
+        generation as one completion.
+
+        Fusing the workflow removes two network round trips per case,
+        typically the dominant share of its latency. Callers needing a
+        single sub-result should keep using the single-shot methods.
+
+        Returns:
+            dict: ``{"analysis": ..., "risk": ..., "communication": ...}``
+        """
+        try:
+            truncated = self._truncate_document(text)
+            case_json = orjson.dumps(
+                case_data, option=orjson.OPT_SORT_KEYS, default=str
+            ).decode()
+            # The bundled email is personalized from comm_context, so the
+            # fields that reach the prompt must be part of the key or one
+            # recipient's email would be served to another.
+            key = _cache_key(
+                self.default_model,
+                "bundle",
+                truncated,
+                case_json,
+                str(comm_context.get('recipient_name', 'Client')),
+                str(comm_context.get('company_name', 'Legal Funding Company')),
+            )
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+            prompt = _CASE_BUNDLE_USER_TMPL.format(
+                text=truncated,
+                case_type=case_data.get('case_type', 'Unknown'),
+                incident_date=case_data.get('incident_date', 'Unknown'),
+                description=case_data.get('description', 'No description'),
+                medical_treatment=case_data.get('medical_treatment', 'Unknown'),
+                insurance_coverage=case_data.get('insurance_coverage', 'Unknown'),
+                prior_claims=case_data.get('prior_claims', 'Unknown'),
+                employment_status=case_data.get('employment_status', 'Unknown'),
+                recipient_name=comm_context.get('recipient_name', 'Client'),
+                company_name=comm_context.get('company_name', 'Legal Funding Company'),
+            )
+            messages = [
+                {"role": "system", "content": _CASE_BUNDLE_SYSTEM},
+                {"role": "user", "content": prompt}
+            ]
+
+            response = await self.chat_completion(
+                messages,
+                temperature=0.2,
+                response_format=_CASE_BUNDLE_FORMAT,
+            )
+
+            try:
+                result = CaseAnalysisBundle.model_validate_json(response).model_dump()
+                self._cache.set(key, result, expire=self._cache_ttl)
+                return result
+            except ValidationError:
+                logger.warning("Failed to parse fused case analysis response")
+                return {
+                    "analysis": _document_fallback(response),
+                    "risk": _risk_fallback(),
+                    "communication": {
+                        "subject": f"Regarding your {case_data.get('case_type', 'case')}",
+                        "content": f"Dear {comm_context.get('recipient_name', 'Client')},\n\nWe hope this message finds you well. We wanted to follow up regarding your case.\n\nBest regards,\n{comm_context.get('company_name', 'Legal Funding Team')}"
+                    },
+                }
+
+        except Exception as e:
+            logger.error(f"Fused case analysis failed: {e}")
+            raise
+
+    async def _gather_limited(
+        self,
+        items: Sequence[Any],
+        call: Callable[[Any], Awaitable[Dict[str, Any]]],
+        max_attempts: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """Run *call* over items concurrently under the shared limiter.
+
+        Failed items are retried with exponential backoff; completed
+        items are never re-run. Raises OpenAIError if any item is still
+        failing after ``max_attempts``.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = list(range(len(items)))
+
+        async def run_one(index: int) -> Dict[str, Any]:
+            await self.limiter.acquire()
+            try:
+                return await call(items[index])
+            finally:
+                self.limiter.release()
+
+        for attempt in range(max_attempts):
+            tasks = [asyncio.create_task(run_one(i)) for i in pending]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+            failed = []
+            for index, outcome in zip(pending, outcomes):
+                if isinstance(outcome, BaseException):
+                    failed.append(index)
+                else:
+                    results[index] = outcome
+            pending = failed
+
+            if not pending:
+                break
+            if attempt + 1 < max_attempts:
+                delay = 2 ** attempt
+                logger.warning(
+                    f"Retrying {len(pending)} failed items in {delay}s",
+                    attempt=attempt + 1,
+                )
+                await asyncio.sleep(delay)
+
+        if pending:
+            raise OpenAIError(
+                f"{len(pending)} of {len(items)} items failed after {max_attempts} attempts"
+            )
+        return results
+
+    async def analyze_documents_many(
+        self,
+        texts: List[str],
+        document_type: str = "legal",
+    ) -> List[Dict[str, Any]]:
+        """Analyze many documents concurrently up to the rate-limit ceiling."""
+        return await self._gather_limited(
+            texts, lambda text: self.analyze_document(text, document_type)
+        )
+
+    async def assess_case_risks_many(
+        self,
+        cases: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Assess many case risks concurrently up to the rate-limit ceiling."""
+        return await self._gather_limited(cases, self.assess_case_risk)
+
+    async def submit_batch_analysis(self, cases: List[Dict[str, Any]]) -> str:
+        """Submit many analyses as a single Batch API job.
+
+        Each case dict needs a ``case_id`` plus either document fields
+        (``text`` and optional ``document_type``) or the risk-assessment
+        fields consumed by ``assess_case_risk``. Batch jobs run at half
+        the synchronous price in a separate rate-limit pool with a
+        24-hour completion window, so this is the path for bulk imports.
+
+        Returns:
+            str: Batch ID to pass to ``await_batch``.
+        """
+        try:
+            lines = []
+            for case in cases:
+                case_id = str(case["case_id"])
+                if "text" in case:
+                    custom_id = f"doc-{case_id}"
+                    messages = self._document_messages(
+                        case["text"], case.get("document_type", "legal")
+                    )
+                    temperature = 0.1
+                    response_format = _DOCUMENT_ANALYSIS_FORMAT
+                else:
+                    custom_id = f"risk-{case_id}"
+                    messages = self._risk_messages(case)
+                    temperature = 0.2
+                    response_format = _RISK_ASSESSMENT_FORMAT
+                lines.append(orjson.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.default_model,
+                        "messages": messages,
+                        "max_tokens": self.max_tokens,
+                        "temperature": temperature,
+                        "response_format": response_format,
+                    },
+                }))
+
+            payload = io.BytesIO(b"\n".join(lines))
+            payload.name = "batch_analysis.jsonl"
+
+            batch_file = await self.client.files.create(file=payload, purpose="batch")
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            logger.info(
+                "OpenAI batch submitted",
+                batch_id=batch.id,
+                items=len(lines),
+            )
+            return batch.id
+
+        except Exception as e:
+            logger.error(f"Batch submission failed: {e}")
+            raise
+
+    async def await_batch(self, batch_id: str, poll_interval: float = 30.0) -> Dict[str, Dict[str, Any]]:
+        """Poll a batch until it finishes and parse its JSONL output.
+
+        Returns:
+            dict: Mapping of case_id to parsed analysis, using the same
+                fallback shapes as the synchronous methods when a
+                response is not valid JSON.
+        """
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in _BATCH_DONE_STATES:
+                break
+            await asyncio.sleep(poll_interval)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise OpenAIError(f"Batch {batch_id} finished with status {batch.status}")
+
+        output = await self.client.files.content(batch.output_file_id)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            item = orjson.loads(line)
+            custom_id = item["custom_id"]
+            kind, _, case_id = custom_id.partition("-")
+
+            if item.get("error"):
+                logger.warning(
+                    "Batch item failed",
+                    custom_id=custom_id,
+                    error=item["error"],
+                )
+                continue
+
+            content = item["response"]["body"]["choices"][0]["message"]["content"]
+            try:
+                results[case_id] = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                logger.warning("Failed to parse JSON response from OpenAI")
+                results[case_id] = (
+                    _document_fallback(content) if kind == "doc" else _risk_fallback()
+                )
+
+        return results
+
 # Singleton instance
 _openai_client = None
 
@@ -1,10 +1,15 @@
 """Pipedrive API client with rate limiting and error handling."""
 
 import asyncio
+import time
 import aiohttp
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+import orjson
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None
 
 from ...config.settings import get_settings
 from ...utils.logging import get_logger
@@ -27,43 +32,77 @@ class PipedriveAPIError(Exception):
 
 
 class AsyncRateLimiter:
-    """Async rate limiter for API requests."""
-    
+    """Async token-bucket rate limiter for API requests.
+
+    Refills at max_calls/period so sustained throughput matches the
+    limit while short bursts drain the bucket instead of stalling the
+    whole client for a full window, then releasing everything at once.
+    """
+
     def __init__(self, max_calls: int, period: int):
         """
         Initialize rate limiter.
-        
+
         Args:
             max_calls: Maximum number of calls allowed.
             period: Time period in seconds.
         """
         self.max_calls = max_calls
         self.period = period
-        self.calls = []
+        self.rate = max_calls / period
+        self.tokens = float(max_calls)
+        self.updated: Optional[float] = None
         self.lock = asyncio.Lock()
-    
+
     async def acquire(self) -> None:
         """Acquire rate limit permission."""
         async with self.lock:
-            now = datetime.utcnow()
-            
-            # Remove old calls outside the time window
-            cutoff = now - timedelta(seconds=self.period)
-            self.calls = [call_time for call_time in self.calls if call_time > cutoff]
-            
-            # Check if we can make a new call
-            if len(self.calls) >= self.max_calls:
-                # Calculate wait time
-                oldest_call = min(self.calls)
-                wait_time = (oldest_call + timedelta(seconds=self.period) - now).total_seconds()
-                
-                if wait_time > 0:
-                    logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
-                    await asyncio.sleep(wait_time)
-                    return await self.acquire()
-            
-            # Record this call
-            self.calls.append(now)
+            now = asyncio.get_running_loop().time()
+            if self.updated is None:
+                self.updated = now
+
+            # Refill tokens accrued since the last call
+            self.tokens = min(
+                self.max_calls,
+                self.tokens + (now - self.updated) * self.rate,
+            )
+            self.updated = now
+
+            if self.tokens < 1.0:
+                # Sleep under the lock: waiters queue FIFO, each leaving
+                # with exactly one token spent.
+                wait_time = (1.0 - self.tokens) / self.rate
+                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+                self.updated = asyncio.get_running_loop().time()
+                self.tokens = 0.0
+            else:
+                self.tokens -= 1.0
+
+    def observe_headers(self, headers: Any) -> None:
+        """Fold server-reported rate-limit state back into the bucket.
+
+        Pipedrive sends X-RateLimit-Remaining on every response; trusting
+        it over the local estimate keeps the bucket honest when other
+        workers share the same API token. A Retry-After drains the bucket
+        and pushes the refill clock forward so concurrent waiters back
+        off immediately instead of piling onto a throttled server.
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                self.tokens = min(self.tokens, float(remaining))
+            except ValueError:
+                pass
+
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                return
+            self.tokens = 0.0
+            self.updated = asyncio.get_running_loop().time() + delay
 
 
 class PipedriveClient:
@@ -87,6 +126,8 @@ class PipedriveClient:
         self.api_token = api_token or settings.pipedrive.api_token
         self.company_domain = company_domain or settings.pipedrive.company_domain
         self.base_url = f"https://{self.company_domain}.pipedrive.com/api/v1"
+        # Precomputed once: urljoin re-parses both URLs on every call.
+        self._base = self.base_url + "/"
         
         # Rate limiter - 90 requests per 10 seconds (buffer for safety)
         self.rate_limiter = AsyncRateLimiter(
@@ -96,22 +137,45 @@ class PipedriveClient:
         
         # HTTP session configuration
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        # All traffic goes to a single Pipedrive host, so the per-host
+        # cap is the effective concurrency ceiling; sized to cover the
+        # full 90-requests/10s budget in flight at once.
         connector = aiohttp.TCPConnector(
-            limit=20,  # Connection pool size
-            limit_per_host=10,
+            limit=100,  # Connection pool size
+            limit_per_host=64,
             ttl_dns_cache=300,
             use_dns_cache=True,
+            keepalive_timeout=60,  # Hold connections through request gaps
+            force_close=False,
         )
-        
+
         self.session = aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
             headers={
                 "User-Agent": "AI-CRM-Multi-Agent/1.0",
                 "Accept": "application/json",
+                "Connection": "keep-alive",
+                # Header auth: keeps the token out of URLs (and access
+                # logs) and spares a params dict per request.
+                "x-api-token": self.api_token,
             }
         )
         
+        # Custom-field metadata changes at human timescales; caching it
+        # keeps sync loops from burning rate-limit budget on re-fetches.
+        self._field_cache: Dict[str, Any] = {}
+        self._field_cache_ttl = 600.0
+
+        # ETags for parameterless GETs (field metadata, webhooks): a 304
+        # revalidation carries no body and skips the JSON decode.
+        self._etag_cache: Dict[str, Any] = {}
+
+        # simdjson parses the multi-MB list responses of initial syncs
+        # several times faster than orjson; the parser buffer is reused,
+        # which is safe because parse + as_dict happen without awaits.
+        self._json_parser = simdjson.Parser() if simdjson is not None else None
+
         logger.info(
             "Pipedrive client initialized",
             company_domain=self.company_domain,
@@ -162,17 +226,37 @@ class PipedriveClient:
         await self.rate_limiter.acquire()
         
         # Prepare request
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
-        request_params = params or {}
-        request_params['api_token'] = self.api_token
-        
+        url = self._base + (endpoint[1:] if endpoint.startswith('/') else endpoint)
+        request_params = params if params else None
+
+        # Encode the body once; None means "no body" to aiohttp, and the
+        # Content-Type header only accompanies an actual payload.
+        # OPT_NAIVE_UTC lets payloads carry datetime objects directly
+        # (timestamps from the DB are naive UTC) instead of callers
+        # pre-rendering isoformat strings.
+        body = orjson.dumps(data, option=orjson.OPT_NAIVE_UTC) if data else None
+        request_headers = {"Content-Type": "application/json"} if body else {}
+        conditional = method == "GET" and not params
+        if conditional and endpoint in self._etag_cache:
+            request_headers["If-None-Match"] = self._etag_cache[endpoint][0]
+
         try:
+            # orjson bypasses aiohttp's stdlib JSON encoder (and its
+            # separate UTF-8 encode step) on request bodies.
             async with self.session.request(
                 method=method,
                 url=url,
                 params=request_params,
-                json=data if data else None,
+                data=body,
+                headers=request_headers or None,
             ) as response:
+
+                # Let the server's own rate-limit accounting steer the bucket
+                self.rate_limiter.observe_headers(response.headers)
+
+                # Revalidated: the cached body is still current
+                if response.status == 304 and conditional and endpoint in self._etag_cache:
+                    return self._etag_cache[endpoint][1]
                 
                 # Handle rate limiting
                 if response.status == 429:
@@ -200,7 +284,7 @@ class PipedriveClient:
                 
                 # Handle other client errors
                 if 400 <= response.status < 500:
-                    error_data = await response.json() if response.content_type == 'application/json' else {}
+                    error_data = orjson.loads(await response.read()) if response.content_type == 'application/json' else {}
                     error_message = error_data.get('error', f"Client error: {response.status}")
                     raise PipedriveAPIError(
                         error_message,
@@ -229,13 +313,22 @@ class PipedriveClient:
                 
                 # Parse successful response
                 if response.content_type == 'application/json':
-                    result = await response.json()
+                    raw = await response.read()
+                    if self._json_parser is not None:
+                        result = self._json_parser.parse(raw).as_dict()
+                    else:
+                        result = orjson.loads(raw)
                     
                     # Check for API-level errors
                     if not result.get('success', True):
                         error_message = result.get('error', 'Unknown API error')
                         raise PipedriveAPIError(error_message, response_data=result)
-                    
+
+                    if conditional:
+                        etag = response.headers.get("ETag")
+                        if etag:
+                            self._etag_cache[endpoint] = (etag, result)
+
                     return result
                 else:
                     return {"success": True, "data": await response.text()}
@@ -254,6 +347,101 @@ class PipedriveClient:
             else:
                 raise PipedriveAPIError(f"Connection error: {e}")
     
+    async def batch_execute(
+        self,
+        ops: List[Callable[[], Awaitable[Any]]],
+    ) -> List[Any]:
+        """
+        Execute independent API operations concurrently.
+
+        A webhook burst that triggers several writes (update_person,
+        create_activity, create_note, ...) no longer serializes in
+        arrival order at the caller layer; the rate limiter throttles
+        the fan-out. Failures surface as an ExceptionGroup.
+
+        Args:
+            ops: Zero-argument callables returning awaitables, e.g.
+                ``lambda: self.update_person(person_id, data)``.
+
+        Returns:
+            list: Results in the same order as ``ops``.
+        """
+        tasks = []
+        async with asyncio.TaskGroup() as tg:
+            for op in ops:
+                tasks.append(tg.create_task(op()))
+        return [task.result() for task in tasks]
+
+    async def _iter_all(
+        self,
+        fetch: Callable[..., Awaitable[Dict[str, Any]]],
+        page_size: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every item from a paginated list endpoint.
+
+        The first page reveals whether more items exist; when the total
+        count is known, the remaining pages are fetched concurrently
+        (the rate limiter throttles the fan-out) and streamed as each
+        completes, so consumers never wait for the slowest page.
+
+        Args:
+            fetch: List method accepting ``limit`` and ``start`` kwargs.
+            page_size: Items per page.
+
+        Yields:
+            dict: Individual items across all pages.
+        """
+        first = await fetch(limit=page_size, start=0)
+        for item in first.get("data") or []:
+            yield item
+
+        pagination = (first.get("additional_data") or {}).get("pagination") or {}
+        if not pagination.get("more_items_in_collection"):
+            return
+
+        total_count = pagination.get("total_count")
+        if total_count:
+            tasks = [
+                asyncio.create_task(fetch(limit=page_size, start=start))
+                for start in range(page_size, total_count, page_size)
+            ]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    page = await task
+                    for item in page.get("data") or []:
+                        yield item
+            finally:
+                for task in tasks:
+                    task.cancel()
+        else:
+            # Total unknown: walk next_start sequentially.
+            start = pagination.get("next_start", page_size)
+            while True:
+                page = await fetch(limit=page_size, start=start)
+                for item in page.get("data") or []:
+                    yield item
+                pagination = (page.get("additional_data") or {}).get("pagination") or {}
+                if not pagination.get("more_items_in_collection"):
+                    return
+                start = pagination.get("next_start", start + page_size)
+
+    def iter_all_persons(self, page_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all persons across pages."""
+        return self._iter_all(self.get_persons, page_size)
+
+    def iter_all_organizations(self, page_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all organizations across pages."""
+        return self._iter_all(self.get_organizations, page_size)
+
+    def iter_all_deals(self, page_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all deals across pages."""
+        return self._iter_all(self.get_deals, page_size)
+
+    def iter_all_activities(self, page_size: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all activities across pages."""
+        return self._iter_all(self.get_activities, page_size)
+
     # Person API methods
     async def get_persons(
         self,
@@ -283,6 +471,39 @@ class PipedriveClient:
     async def delete_person(self, person_id: int) -> Dict[str, Any]:
         """Delete a person."""
         return await self._make_request("DELETE", f"/persons/{person_id}")
+
+    async def batch_upsert_persons(
+        self,
+        persons: List[Dict[str, Any]],
+    ) -> List[int]:
+        """
+        Upsert many persons and return their Pipedrive ids, in order.
+
+        Pipedrive v1 has no bulk persons endpoint, so this fans the
+        writes out concurrently through batch_execute with the rate
+        limiter pacing the burst. Each entry with a ``pipedrive_id`` key
+        is updated under that id; the rest are created.
+
+        Args:
+            persons: Person payloads as accepted by create_person,
+                optionally carrying a ``pipedrive_id`` for updates.
+
+        Returns:
+            list: Person ids aligned with the input order.
+        """
+        async def _upsert(person_data: Dict[str, Any]) -> int:
+            person_id = person_data.pop("pipedrive_id", None)
+            if person_id:
+                await self.update_person(person_id, person_data)
+                return person_id
+            response = await self.create_person(person_data)
+            return response["data"]["id"]
+
+        ops = [
+            (lambda data=dict(person): _upsert(data))
+            for person in persons
+        ]
+        return await self.batch_execute(ops)
     
     # Organization API methods
     async def get_organizations(
@@ -363,17 +584,27 @@ class PipedriveClient:
         return await self._make_request("POST", "/notes", data=note_data)
     
     # Custom fields API methods
+    async def _get_fields_cached(self, endpoint: str) -> Dict[str, Any]:
+        """Fetch field metadata through the TTL cache."""
+        cached = self._field_cache.get(endpoint)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        result = await self._make_request("GET", endpoint)
+        self._field_cache[endpoint] = (time.monotonic() + self._field_cache_ttl, result)
+        return result
+
     async def get_person_fields(self) -> Dict[str, Any]:
         """Get custom fields for persons."""
-        return await self._make_request("GET", "/personFields")
-    
+        return await self._get_fields_cached("/personFields")
+
     async def get_deal_fields(self) -> Dict[str, Any]:
         """Get custom fields for deals."""
-        return await self._make_request("GET", "/dealFields")
-    
+        return await self._get_fields_cached("/dealFields")
+
     async def get_organization_fields(self) -> Dict[str, Any]:
         """Get custom fields for organizations."""
-        return await self._make_request("GET", "/organizationFields")
+        return await self._get_fields_cached("/organizationFields")
     
     # Webhook API methods
     async def get_webhooks(self) -> Dict[str, Any]:
@@ -1,21 +1,173 @@
 """Pipedrive synchronization service for bidirectional data sync."""
 
 import asyncio
+import hashlib
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+import orjson
+
+try:
+    # C parser, ~10x faster on Pipedrive's "Z"-suffixed timestamps
+    from ciso8601 import parse_datetime
+except ImportError:  # pragma: no cover - optional dependency
+    # datetime.fromisoformat accepts a trailing "Z" since 3.11, so the
+    # fallback needs no string surgery either.
+    parse_datetime = datetime.fromisoformat
+
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from ...config.database import get_database_session
-from ...models.database import Plaintiff, LawFirm, Lawyer, Case
+from ...models.database import Plaintiff, LawFirm, Lawyer, Case, CaseType
 from ...utils.logging import get_logger
-from .client import PipedriveClient, PipedriveAPIError
+from .client import PipedriveClient, PipedriveAPIError, RateLimitError
 
 logger = get_logger(__name__)
 
 
+class PersonFields(NamedTuple):
+    """Name and contact fields extracted from a Pipedrive person payload."""
+
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+
+
+def _extract_person_fields(person_data: Dict[str, Any]) -> PersonFields:
+    """Parse the shared person fields once for the create/update helpers."""
+    # partition splits off the first name without allocating a full list
+    first_name, _, last_name = person_data.get("name", "").strip().partition(" ")
+    emails = person_data.get("email", [])
+    phones = person_data.get("phone", [])
+    return PersonFields(
+        first_name=first_name,
+        last_name=last_name.lstrip(),
+        email=emails[0]["value"] if emails else "",
+        phone=phones[0]["value"] if phones else "",
+    )
+
+
+def _payload_hash(payload: Dict[str, Any]) -> str:
+    """16-char content hash of a mapped payload, as sent on the wire."""
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC),
+        digest_size=8,
+    ).hexdigest()
+
+
+def _is_transient_api_error(exc: BaseException) -> bool:
+    """Retry rate-limit and server-side failures, not validation errors."""
+    if isinstance(exc, RateLimitError):
+        return True
+    if isinstance(exc, PipedriveAPIError):
+        status = exc.status_code
+        return status is None or status == 429 or status >= 500
+    return False
+
+
+# One more jittered round after the client's own retries give up, so a
+# sporadic 429/5xx costs one entity a re-attempt instead of counting
+# against the bulk failed tally and forcing a whole-job re-run.
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient_api_error),
+    wait=wait_random_exponential(max=30),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+
+# Statement built once at import with a bindparam() placeholder: every
+# execution hits SQLAlchemy's compiled-SQL cache instead of rebuilding
+# and re-compiling the select per call. Primary-key lookups go through
+# session.get() instead, which consults the identity map first.
+_PLAINTIFF_BY_PERSON_ID = select(Plaintiff).where(
+    Plaintiff.pipedrive_person_id == bindparam("person_id")
+)
+
+# Outbound sync reads a fixed handful of columns; load_only keeps the
+# rest of the wide plaintiff row (JSONB blobs, address fields, ...) in
+# the database, and the joined law firm ships only its Pipedrive id.
+_PLAINTIFF_SYNC_LOAD = (
+    load_only(
+        Plaintiff.full_name,
+        Plaintiff.first_name,
+        Plaintiff.last_name,
+        Plaintiff.email,
+        Plaintiff.phone,
+        Plaintiff.created_at,
+        Plaintiff.case_type,
+        Plaintiff.case_status,
+        Plaintiff.pipedrive_person_id,
+        Plaintiff.pipedrive_person_hash,
+        Plaintiff.pipedrive_deal_id,
+    ),
+    selectinload(Plaintiff.law_firm).load_only(LawFirm.pipedrive_org_id),
+)
+
+# Pure lookup tables, built once: the mapping helpers run inside the
+# bulk loop and should not reconstruct their dicts per call.
+_BASE_DEAL_VALUES = {
+    "personal_injury": 25000,
+    "medical_malpractice": 100000,
+    "auto_accident": 30000,
+    "slip_and_fall": 20000,
+    "workers_compensation": 15000,
+    "product_liability": 75000,
+    "wrongful_death": 250000,
+    "employment": 50000,
+}
+
+# Maps case status to actual Pipedrive pipeline stages.
+_STAGE_MAPPING = {
+    "initial": 1,
+    "qualifying": 2,
+    "qualified": 3,
+    "document_collection": 4,
+    "underwriting": 5,
+    "approved": 6,
+    "funded": 7,
+    "settled": 8,
+    "closed": 9,
+    "rejected": 10,
+}
+
+# Deal titles reuse the same handful of case-type strings, so they are
+# rendered once from the enum instead of replace().title() per deal.
+_CASE_TYPE_TITLE = {
+    case_type: case_type.value.replace("_", " ").title() for case_type in CaseType
+}
+
+_FIELD_MAPPINGS = {
+    "person": {
+        "first_name": "name",  # Combined in Pipedrive
+        "last_name": "name",   # Combined in Pipedrive
+        "email": "email",
+        "phone": "phone",
+    },
+    "organization": {
+        "name": "name",
+        "contact_email": "email",
+        "contact_phone": "phone",
+    },
+    "deal": {
+        "title": "title",
+        "case_status": "stage_id",
+        "estimated_value": "value",
+    },
+}
+
+
 class PipedriveSyncService:
     """
     Service for synchronizing data between AI CRM and Pipedrive.
@@ -32,7 +184,14 @@ class PipedriveSyncService:
             client: Pipedrive client instance (creates new if not provided).
         """
         self.client = client or PipedriveClient()
-        self.field_mappings = self._get_field_mappings()
+        self.field_mappings = _FIELD_MAPPINGS
+
+        # Recently verified Pipedrive org ids mapped to their expiry
+        # time: re-syncing an already-synced law firm within the TTL
+        # skips the existence GET entirely. Kept as a plain dict with
+        # monotonic expiries, same as the client's field cache.
+        self._org_exists_cache: Dict[int, float] = {}
+        self._org_exists_ttl = 300.0
         
     async def sync_plaintiff_to_pipedrive(
         self,
@@ -51,54 +210,95 @@ class PipedriveSyncService:
         """
         async with get_database_session() as session:
             # Get plaintiff with relationships
-            stmt = select(Plaintiff).where(Plaintiff.id == plaintiff_id)
-            result = await session.execute(stmt)
-            plaintiff = result.scalar_one_or_none()
-            
+            plaintiff = await session.get(
+                Plaintiff,
+                plaintiff_id,
+                options=_PLAINTIFF_SYNC_LOAD,
+            )
+
             if not plaintiff:
                 raise ValueError(f"Plaintiff {plaintiff_id} not found")
-            
-            sync_result = {
-                "plaintiff_id": str(plaintiff_id),
-                "success": False,
-                "person_id": None,
-                "deal_id": None,
-                "errors": [],
-                "warnings": [],
-            }
-            
-            try:
+
+            return await self._sync_plaintiff_obj(session, plaintiff, force_update)
+
+    async def _sync_plaintiff_obj(
+        self,
+        session: AsyncSession,
+        plaintiff: Plaintiff,
+        force_update: bool = False,
+        commit: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Sync an already-loaded plaintiff to Pipedrive.
+
+        The bulk path prefetches whole batches and passes the ORM objects
+        here with ``commit=False``, committing once per batch instead of
+        per row.
+        """
+        sync_result = {
+            "plaintiff_id": str(plaintiff.id),
+            "success": False,
+            "person_id": None,
+            "deal_id": None,
+            "errors": [],
+            "warnings": [],
+        }
+
+        try:
+            if (
+                plaintiff.pipedrive_person_id
+                and plaintiff.pipedrive_deal_id
+                and not force_update
+            ):
+                # Both records already exist, so the deal payload only
+                # needs the known person id — run the two updates
+                # concurrently instead of serializing on the person sync.
+                person_result, deal_result = await asyncio.gather(
+                    self._sync_plaintiff_as_person(plaintiff, force_update),
+                    self._sync_plaintiff_as_deal(
+                        plaintiff, plaintiff.pipedrive_person_id, force_update
+                    ),
+                )
+            else:
                 # Sync as person
                 person_result = await self._sync_plaintiff_as_person(plaintiff, force_update)
-                sync_result["person_id"] = person_result["person_id"]
-                
+
                 # Sync as deal
                 deal_result = await self._sync_plaintiff_as_deal(plaintiff, person_result["person_id"], force_update)
-                sync_result["deal_id"] = deal_result["deal_id"]
-                
-                # Update plaintiff with Pipedrive IDs
+
+            sync_result["person_id"] = person_result["person_id"]
+            sync_result["person_hash"] = person_result["person_hash"]
+            sync_result["deal_id"] = deal_result["deal_id"]
+
+            # Update plaintiff with Pipedrive IDs. The bulk path persists
+            # ids itself with one executemany per batch, so it skips the
+            # per-object attribute writes (and the row-by-row UPDATEs the
+            # flush would emit for them).
+            if commit:
                 plaintiff.pipedrive_person_id = person_result["person_id"]
+                plaintiff.pipedrive_person_hash = person_result["person_hash"]
                 plaintiff.pipedrive_deal_id = deal_result["deal_id"]
                 await session.commit()
-                
-                sync_result["success"] = True
-                
-                logger.info(
-                    "Plaintiff synced to Pipedrive successfully",
-                    plaintiff_id=str(plaintiff_id),
-                    person_id=person_result["person_id"],
-                    deal_id=deal_result["deal_id"],
-                )
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to sync plaintiff to Pipedrive: {e}",
-                    plaintiff_id=str(plaintiff_id),
-                )
-                sync_result["errors"].append(str(e))
+
+            sync_result["success"] = True
+
+            logger.info(
+                "Plaintiff synced to Pipedrive successfully",
+                plaintiff_id=sync_result["plaintiff_id"],
+                person_id=person_result["person_id"],
+                deal_id=deal_result["deal_id"],
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to sync plaintiff to Pipedrive: {e}",
+                plaintiff_id=sync_result["plaintiff_id"],
+            )
+            sync_result["errors"].append(str(e))
+            if commit:
                 await session.rollback()
-            
-            return sync_result
+
+        return sync_result
     
     async def sync_law_firm_to_pipedrive(
         self,
@@ -116,68 +316,88 @@ class PipedriveSyncService:
             dict: Sync result with organization_id.
         """
         async with get_database_session() as session:
-            stmt = select(LawFirm).where(LawFirm.id == law_firm_id)
-            result = await session.execute(stmt)
-            law_firm = result.scalar_one_or_none()
-            
+            law_firm = await session.get(LawFirm, law_firm_id)
+
             if not law_firm:
                 raise ValueError(f"Law firm {law_firm_id} not found")
-            
-            sync_result = {
-                "law_firm_id": str(law_firm_id),
-                "success": False,
-                "organization_id": None,
-                "errors": [],
-            }
-            
-            try:
-                # Check if already synced
-                if law_firm.pipedrive_org_id and not force_update:
-                    # Verify organization still exists in Pipedrive
-                    try:
-                        await self.client.get_organization(law_firm.pipedrive_org_id)
-                        sync_result["organization_id"] = law_firm.pipedrive_org_id
-                        sync_result["success"] = True
-                        return sync_result
-                    except PipedriveAPIError:
-                        # Organization doesn't exist, need to recreate
-                        law_firm.pipedrive_org_id = None
-                
-                # Map law firm data to Pipedrive format
-                org_data = self._map_law_firm_to_organization(law_firm)
-                
-                if law_firm.pipedrive_org_id:
-                    # Update existing organization
-                    response = await self.client.update_organization(
-                        law_firm.pipedrive_org_id,
-                        org_data
+
+            return await self._sync_law_firm_obj(session, law_firm, force_update)
+
+    async def _sync_law_firm_obj(
+        self,
+        session: AsyncSession,
+        law_firm: LawFirm,
+        force_update: bool = False,
+        commit: bool = True,
+    ) -> Dict[str, Any]:
+        """Sync an already-loaded law firm to Pipedrive as organization."""
+        sync_result = {
+            "law_firm_id": str(law_firm.id),
+            "success": False,
+            "organization_id": None,
+            "errors": [],
+        }
+
+        try:
+            # Check if already synced
+            if law_firm.pipedrive_org_id and not force_update:
+                org_id = law_firm.pipedrive_org_id
+                if self._org_exists_cache.get(org_id, 0.0) > time.monotonic():
+                    sync_result["organization_id"] = org_id
+                    sync_result["success"] = True
+                    return sync_result
+
+                # Verify organization still exists in Pipedrive
+                try:
+                    await self.client.get_organization(org_id)
+                    self._org_exists_cache[org_id] = (
+                        time.monotonic() + self._org_exists_ttl
                     )
-                    sync_result["organization_id"] = law_firm.pipedrive_org_id
-                else:
-                    # Create new organization
-                    response = await self.client.create_organization(org_data)
-                    organization_id = response["data"]["id"]
-                    law_firm.pipedrive_org_id = organization_id
-                    sync_result["organization_id"] = organization_id
-                
-                await session.commit()
-                sync_result["success"] = True
-                
-                logger.info(
-                    "Law firm synced to Pipedrive successfully",
-                    law_firm_id=str(law_firm_id),
-                    organization_id=sync_result["organization_id"],
-                )
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to sync law firm to Pipedrive: {e}",
-                    law_firm_id=str(law_firm_id),
+                    sync_result["organization_id"] = org_id
+                    sync_result["success"] = True
+                    return sync_result
+                except PipedriveAPIError:
+                    # Organization doesn't exist, need to recreate
+                    self._org_exists_cache.pop(org_id, None)
+                    law_firm.pipedrive_org_id = None
+
+            # Map law firm data to Pipedrive format
+            org_data = self._map_law_firm_to_organization(law_firm)
+
+            if law_firm.pipedrive_org_id:
+                # Update existing organization
+                response = await self.client.update_organization(
+                    law_firm.pipedrive_org_id,
+                    org_data
                 )
-                sync_result["errors"].append(str(e))
+                sync_result["organization_id"] = law_firm.pipedrive_org_id
+            else:
+                # Create new organization
+                response = await self.client.create_organization(org_data)
+                organization_id = response["data"]["id"]
+                law_firm.pipedrive_org_id = organization_id
+                sync_result["organization_id"] = organization_id
+
+            if commit:
+                await session.commit()
+            sync_result["success"] = True
+
+            logger.info(
+                "Law firm synced to Pipedrive successfully",
+                law_firm_id=sync_result["law_firm_id"],
+                organization_id=sync_result["organization_id"],
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Failed to sync law firm to Pipedrive: {e}",
+                law_firm_id=sync_result["law_firm_id"],
+            )
+            sync_result["errors"].append(str(e))
+            if commit:
                 await session.rollback()
-            
-            return sync_result
+
+        return sync_result
     
     async def sync_from_pipedrive(
         self,
@@ -227,6 +447,7 @@ class PipedriveSyncService:
         
         return sync_result
     
+    @_retry_transient
     async def _sync_plaintiff_as_person(
         self,
         plaintiff: Plaintiff,
@@ -235,8 +456,19 @@ class PipedriveSyncService:
         """Sync plaintiff as Pipedrive person."""
         # Map plaintiff data to person format
         person_data = self._map_plaintiff_to_person(plaintiff)
-        
+        new_hash = _payload_hash(person_data)
+
         if plaintiff.pipedrive_person_id and not force_update:
+            # Nothing mapped has changed since the last push: skip the
+            # outbound call entirely. Bulk re-syncs over mostly-stable
+            # data turn into hash comparisons instead of HTTP updates.
+            if new_hash == plaintiff.pipedrive_person_hash:
+                return {
+                    "person_id": plaintiff.pipedrive_person_id,
+                    "person_hash": new_hash,
+                    "skipped": True,
+                }
+
             # Update existing person
             response = await self.client.update_person(
                 plaintiff.pipedrive_person_id,
@@ -247,9 +479,10 @@ class PipedriveSyncService:
             # Create new person
             response = await self.client.create_person(person_data)
             person_id = response["data"]["id"]
-        
-        return {"person_id": person_id}
+
+        return {"person_id": person_id, "person_hash": new_hash}
     
+    @_retry_transient
     async def _sync_plaintiff_as_deal(
         self,
         plaintiff: Plaintiff,
@@ -286,14 +519,15 @@ class PipedriveSyncService:
         
         # Check if we need to update based on timestamp
         if last_sync:
-            update_time = datetime.fromisoformat(person_data["update_time"].replace("Z", "+00:00"))
+            update_time = parse_datetime(person_data["update_time"])
             if update_time <= last_sync:
                 return {"action": "skipped", "reason": "no_changes"}
         
         async with get_database_session() as session:
             # Check if plaintiff already exists
-            stmt = select(Plaintiff).where(Plaintiff.pipedrive_person_id == person_id)
-            result = await session.execute(stmt)
+            result = await session.execute(
+                _PLAINTIFF_BY_PERSON_ID, {"person_id": person_id}
+            )
             plaintiff = result.scalar_one_or_none()
             
             if plaintiff:
@@ -319,7 +553,8 @@ class PipedriveSyncService:
             "name": plaintiff.full_name,
             "email": [{"value": plaintiff.email, "primary": True}] if plaintiff.email else [],
             "phone": [{"value": plaintiff.phone, "primary": True}] if plaintiff.phone else [],
-            "add_time": plaintiff.created_at.isoformat(),
+            # Serialized natively by orjson in the client (OPT_NAIVE_UTC)
+            "add_time": plaintiff.created_at,
             "visible_to": "3",  # Visible to entire company
             # Custom fields mapping would go here
         }
@@ -330,12 +565,12 @@ class PipedriveSyncService:
         deal_value = self._estimate_deal_value(plaintiff)
         
         return {
-            "title": f"{plaintiff.full_name} - {plaintiff.case_type.value.replace('_', ' ').title()}",
+            "title": f"{plaintiff.full_name} - {_CASE_TYPE_TITLE[plaintiff.case_type]}",
             "person_id": person_id,
             "org_id": plaintiff.law_firm.pipedrive_org_id if plaintiff.law_firm else None,
             "value": deal_value,
             "currency": "USD",
-            "add_time": plaintiff.created_at.isoformat(),
+            "add_time": plaintiff.created_at,
             "visible_to": "3",
             "status": "open",
             "stage_id": self._map_case_status_to_stage(plaintiff.case_status),
@@ -347,63 +582,27 @@ class PipedriveSyncService:
         return {
             "name": law_firm.name,
             "visible_to": "3",
-            "add_time": law_firm.created_at.isoformat(),
+            "add_time": law_firm.created_at,
             # Custom fields mapping would go here
         }
     
     def _estimate_deal_value(self, plaintiff: Plaintiff) -> int:
         """Estimate deal value based on case type and other factors."""
-        base_values = {
-            "personal_injury": 25000,
-            "medical_malpractice": 100000,
-            "auto_accident": 30000,
-            "slip_and_fall": 20000,
-            "workers_compensation": 15000,
-            "product_liability": 75000,
-            "wrongful_death": 250000,
-            "employment": 50000,
-        }
-        
-        return base_values.get(plaintiff.case_type.value, 25000)
-    
+        return _BASE_DEAL_VALUES.get(plaintiff.case_type.value, 25000)
+
     def _map_case_status_to_stage(self, case_status) -> int:
         """Map case status to Pipedrive pipeline stage."""
-        # This would map to actual Pipedrive pipeline stages
-        stage_mapping = {
-            "initial": 1,
-            "qualifying": 2,
-            "qualified": 3,
-            "document_collection": 4,
-            "underwriting": 5,
-            "approved": 6,
-            "funded": 7,
-            "settled": 8,
-            "closed": 9,
-            "rejected": 10,
-        }
-        
-        return stage_mapping.get(case_status.value, 1)
+        return _STAGE_MAPPING.get(case_status.value, 1)
     
     def _create_plaintiff_from_person_data(self, person_data: Dict[str, Any]) -> Plaintiff:
         """Create plaintiff from Pipedrive person data."""
-        # Extract name parts
-        name_parts = person_data.get("name", "").split()
-        first_name = name_parts[0] if name_parts else ""
-        last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
-        
-        # Extract email
-        emails = person_data.get("email", [])
-        email = emails[0]["value"] if emails else ""
-        
-        # Extract phone
-        phones = person_data.get("phone", [])
-        phone = phones[0]["value"] if phones else ""
-        
+        fields = _extract_person_fields(person_data)
+
         return Plaintiff(
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            phone=phone,
+            first_name=fields.first_name,
+            last_name=fields.last_name,
+            email=fields.email,
+            phone=fields.phone,
             pipedrive_person_id=person_data["id"],
             case_type="other",  # Default, would be determined later
             case_status="initial",
@@ -416,57 +615,37 @@ class PipedriveSyncService:
         person_data: Dict[str, Any]
     ) -> None:
         """Update plaintiff with Pipedrive person data."""
-        # Update name if changed
-        name_parts = person_data.get("name", "").split()
-        if name_parts:
-            plaintiff.first_name = name_parts[0]
-            plaintiff.last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
-        
-        # Update email if changed
-        emails = person_data.get("email", [])
-        if emails:
-            plaintiff.email = emails[0]["value"]
-        
-        # Update phone if changed
-        phones = person_data.get("phone", [])
-        if phones:
-            plaintiff.phone = phones[0]["value"]
+        fields = _extract_person_fields(person_data)
+
+        # Only overwrite fields the payload actually carries
+        if fields.first_name:
+            plaintiff.first_name = fields.first_name
+            plaintiff.last_name = fields.last_name
+        if fields.email:
+            plaintiff.email = fields.email
+        if fields.phone:
+            plaintiff.phone = fields.phone
     
     def _get_field_mappings(self) -> Dict[str, Dict[str, str]]:
         """Get field mappings between AI CRM and Pipedrive."""
-        return {
-            "person": {
-                "first_name": "name",  # Combined in Pipedrive
-                "last_name": "name",   # Combined in Pipedrive
-                "email": "email",
-                "phone": "phone",
-            },
-            "organization": {
-                "name": "name",
-                "contact_email": "email",
-                "contact_phone": "phone",
-            },
-            "deal": {
-                "title": "title",
-                "case_status": "stage_id",
-                "estimated_value": "value",
-            },
-        }
+        return _FIELD_MAPPINGS
     
     async def bulk_sync_to_pipedrive(
         self,
         entity_type: str,
         entity_ids: List[UUID],
-        batch_size: int = 10
+        batch_size: int = 10,
+        max_concurrent_batches: int = 3,
     ) -> Dict[str, Any]:
         """
         Bulk sync entities to Pipedrive.
-        
+
         Args:
             entity_type: Type of entity to sync.
             entity_ids: List of entity IDs.
             batch_size: Number of entities to process concurrently.
-            
+            max_concurrent_batches: Batches allowed in flight at once.
+
         Returns:
             dict: Bulk sync results.
         """
@@ -474,42 +653,27 @@ class PipedriveSyncService:
             "total": len(entity_ids),
             "successful": 0,
             "failed": 0,
-            "errors": [],
+            # Bounded: a pathological run (every entity failing) keeps
+            # the newest thousand messages instead of growing without
+            # limit; counts still cover everything.
+            "errors": deque(maxlen=1000),
         }
-        
-        # Process in batches to avoid overwhelming the API
-        for i in range(0, len(entity_ids), batch_size):
-            batch = entity_ids[i:i + batch_size]
-            
-            # Create tasks for concurrent processing
-            tasks = []
-            for entity_id in batch:
-                if entity_type == "plaintiff":
-                    task = self.sync_plaintiff_to_pipedrive(entity_id)
-                elif entity_type == "law_firm":
-                    task = self.sync_law_firm_to_pipedrive(entity_id)
-                else:
-                    continue
-                
-                tasks.append(task)
-            
-            # Execute batch concurrently
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    results["failed"] += 1
-                    results["errors"].append(str(result))
-                elif result.get("success"):
-                    results["successful"] += 1
-                else:
-                    results["failed"] += 1
-                    results["errors"].extend(result.get("errors", []))
-            
-            # Small delay between batches
-            await asyncio.sleep(1)
-        
+
+        async for result in self.bulk_sync_to_pipedrive_stream(
+            entity_type,
+            entity_ids,
+            batch_size=batch_size,
+            max_concurrent_batches=max_concurrent_batches,
+        ):
+            if result.get("success"):
+                results["successful"] += 1
+            else:
+                results["failed"] += 1
+                results["errors"].extend(result.get("errors", []))
+
+        # Callers expect a plain JSON-serializable list
+        results["errors"] = list(results["errors"])
+
         logger.info(
             f"Bulk sync completed",
             entity_type=entity_type,
@@ -517,5 +681,140 @@ class PipedriveSyncService:
             successful=results["successful"],
             failed=results["failed"],
         )
-        
-        return results
\ No newline at end of file
+
+        return results
+
+    async def bulk_sync_to_pipedrive_stream(
+        self,
+        entity_type: str,
+        entity_ids: List[UUID],
+        batch_size: int = 10,
+        max_concurrent_batches: int = 3,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Bulk sync entities, yielding per-entity results as they finish.
+
+        Results arrive in batch-completion order, not input order, so
+        downstream consumers (audit logging, webhook fan-out) can start
+        while later batches are still in flight instead of waiting for
+        the aggregate dict.
+
+        Yields:
+            dict: Per-entity sync result.
+        """
+        # Batches run concurrently under a semaphore instead of strictly
+        # one after another, so a single slow entity only delays its own
+        # batch's commit while the rest of the pipeline keeps moving;
+        # steady-state throughput is set by the client's rate limiter.
+        sem = asyncio.Semaphore(max_concurrent_batches)
+
+        async def run_batch(batch: List[UUID]) -> List[Dict[str, Any]]:
+            async with sem:
+                return await self._sync_batch(entity_type, batch)
+
+        tasks = [
+            asyncio.create_task(run_batch(entity_ids[i:i + batch_size]))
+            for i in range(0, len(entity_ids), batch_size)
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                for result in await finished:
+                    yield result
+        finally:
+            # Abandoned generator: don't leave batches running silently
+            for task in tasks:
+                task.cancel()
+
+    async def _sync_batch(
+        self,
+        entity_type: str,
+        batch: List[UUID],
+    ) -> List[Dict[str, Any]]:
+        """
+        Sync one prefetched batch and return per-entity result dicts.
+
+        Exceptions from individual sync tasks are folded into failed
+        result dicts so a bad entity never cancels its siblings.
+        """
+        # One session and one IN-list query per batch instead of a
+        # session and single-row SELECT per entity; the sync helpers
+        # receive preloaded objects and defer the commit.
+        async with get_database_session() as session:
+            if entity_type == "plaintiff":
+                rows = await session.execute(
+                    select(Plaintiff)
+                    .where(Plaintiff.id.in_(batch))
+                    .options(*_PLAINTIFF_SYNC_LOAD)
+                )
+                entities = rows.scalars().all()
+                tasks = [
+                    self._sync_plaintiff_obj(session, entity, commit=False)
+                    for entity in entities
+                ]
+            elif entity_type == "law_firm":
+                rows = await session.execute(
+                    select(LawFirm).where(LawFirm.id.in_(batch))
+                )
+                entities = rows.scalars().all()
+                tasks = [
+                    self._sync_law_firm_obj(session, entity, commit=False)
+                    for entity in entities
+                ]
+            else:
+                return []
+
+            found = {entity.id for entity in entities}
+            outcomes = [
+                {
+                    "entity_id": str(entity_id),
+                    "success": False,
+                    "errors": [f"{entity_type} {entity_id} not found"],
+                }
+                for entity_id in batch
+                if entity_id not in found
+            ]
+
+            # Execute batch concurrently; the API calls fan out while
+            # the shared session is only touched at the final commit.
+            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            if entity_type == "plaintiff":
+                # One executemany UPDATE for the whole batch instead
+                # of a flushed UPDATE per dirtied ORM object.
+                id_rows = [
+                    {
+                        "_id": entity.id,
+                        "_person_id": result["person_id"],
+                        "_person_hash": result["person_hash"],
+                        "_deal_id": result["deal_id"],
+                    }
+                    for entity, result in zip(entities, batch_results)
+                    if isinstance(result, dict) and result.get("success")
+                ]
+                if id_rows:
+                    await session.execute(
+                        Plaintiff.__table__.update()
+                        .where(Plaintiff.__table__.c.id == bindparam("_id"))
+                        .values(
+                            pipedrive_person_id=bindparam("_person_id"),
+                            pipedrive_person_hash=bindparam("_person_hash"),
+                            pipedrive_deal_id=bindparam("_deal_id"),
+                        ),
+                        id_rows,
+                    )
+
+            await session.commit()
+
+        for entity, result in zip(entities, batch_results):
+            if isinstance(result, BaseException):
+                outcomes.append(
+                    {
+                        "entity_id": str(entity.id),
+                        "success": False,
+                        "errors": [str(result)],
+                    }
+                )
+            else:
+                outcomes.append(result)
+
+        return outcomes
\ No newline at end of file
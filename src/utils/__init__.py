@@ -1,5 +1,6 @@
 """Shared utilities for the AI CRM system."""
 
 from .logging import setup_logging, get_logger
+from .text import NON_DIGITS
 
-__all__ = ["setup_logging", "get_logger"]
\ No newline at end of file
+__all__ = ["setup_logging", "get_logger", "NON_DIGITS"]
\ No newline at end of file
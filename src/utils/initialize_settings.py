@@ -1,7 +1,7 @@
 """Initialize default settings in the database."""
 
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from ..models.database.settings import SettingsCategory, Setting
 from ..models.database.base import Base
 from ..config.settings import get_settings
@@ -112,12 +112,14 @@ def initialize_default_settings(db: Session):
             }
         ]
         
-        for setting_data in system_settings:
-            setting = Setting(
-                category_id=system_category.id,
-                **setting_data
-            )
-            db.add(setting)
+        # One multi-values INSERT instead of a per-row add loop
+        db.execute(
+            insert(Setting),
+            [
+                {"category_id": system_category.id, **setting_data}
+                for setting_data in system_settings
+            ],
+        )
     
     # Agent Settings Category
     agent_category = db.query(SettingsCategory).filter(
@@ -187,12 +189,14 @@ def initialize_default_settings(db: Session):
             }
         ]
         
-        for setting_data in agent_settings:
-            setting = Setting(
-                category_id=agent_category.id,
-                **setting_data
-            )
-            db.add(setting)
+        # One multi-values INSERT instead of a per-row add loop
+        db.execute(
+            insert(Setting),
+            [
+                {"category_id": agent_category.id, **setting_data}
+                for setting_data in agent_settings
+            ],
+        )
     
     # AI Settings Category
     ai_category = db.query(SettingsCategory).filter(
@@ -264,12 +268,14 @@ def initialize_default_settings(db: Session):
             }
         ]
         
-        for setting_data in ai_settings:
-            setting = Setting(
-                category_id=ai_category.id,
-                **setting_data
-            )
-            db.add(setting)
+        # One multi-values INSERT instead of a per-row add loop
+        db.execute(
+            insert(Setting),
+            [
+                {"category_id": ai_category.id, **setting_data}
+                for setting_data in ai_settings
+            ],
+        )
     
     # Integrations Settings Category
     integrations_category = db.query(SettingsCategory).filter(
@@ -338,12 +344,14 @@ def initialize_default_settings(db: Session):
             }
         ]
         
-        for setting_data in integration_settings:
-            setting = Setting(
-                category_id=integrations_category.id,
-                **setting_data
-            )
-            db.add(setting)
+        # One multi-values INSERT instead of a per-row add loop
+        db.execute(
+            insert(Setting),
+            [
+                {"category_id": integrations_category.id, **setting_data}
+                for setting_data in integration_settings
+            ],
+        )
     
     # Security Settings Category
     security_category = db.query(SettingsCategory).filter(
@@ -413,12 +421,14 @@ def initialize_default_settings(db: Session):
             }
         ]
         
-        for setting_data in security_settings:
-            setting = Setting(
-                category_id=security_category.id,
-                **setting_data
-            )
-            db.add(setting)
+        # One multi-values INSERT instead of a per-row add loop
+        db.execute(
+            insert(Setting),
+            [
+                {"category_id": security_category.id, **setting_data}
+                for setting_data in security_settings
+            ],
+        )
     
     try:
         db.commit()
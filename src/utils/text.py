@@ -0,0 +1,8 @@
+"""Shared text-processing tables and helpers."""
+
+# Deletion table stripping ASCII non-digits in one C-level
+# str.translate pass, avoiding a regex-engine invocation per phone
+# number. Shared by every call site that normalizes phone input.
+NON_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
@@ -0,0 +1,56 @@
+"""Tests for the binary-COPY bulk plaintiff import."""
+
+from src.database.bulk_import import PLAINTIFF_COPY_COLUMNS, _to_record
+from src.models.database.plaintiff import (
+    CaseStatus,
+    CaseType,
+    ContactMethod,
+    Plaintiff,
+)
+
+
+class TestPlaintiffCopyColumns:
+    """Tests for the COPY column list and record construction."""
+
+    def test_copy_list_covers_not_null_columns_without_server_default(self):
+        """COPY bypasses ORM defaults, so every NOT NULL column without
+        a server default must be shipped explicitly."""
+        missing = [
+            column.name
+            for column in Plaintiff.__table__.columns
+            if not column.nullable
+            and column.server_default is None
+            and column.name not in PLAINTIFF_COPY_COLUMNS
+        ]
+        assert missing == []
+
+    def test_record_matches_column_list(self):
+        record = _to_record(
+            {"first_name": "Jane", "last_name": "Doe", "email": "jane@example.com"}
+        )
+        assert len(record) == len(PLAINTIFF_COPY_COLUMNS)
+
+    def test_defaults_fill_not_null_enum_columns(self):
+        record = _to_record(
+            {"first_name": "Jane", "last_name": "Doe", "email": "jane@example.com"}
+        )
+        by_column = dict(zip(PLAINTIFF_COPY_COLUMNS, record))
+        assert by_column["case_type"] == CaseType.OTHER.name
+        assert by_column["case_status"] == CaseStatus.INITIAL.name
+        assert by_column["preferred_contact_method"] == ContactMethod.EMAIL.name
+
+    def test_enum_instances_are_sent_as_names(self):
+        record = _to_record(
+            {
+                "first_name": "Jane",
+                "last_name": "Doe",
+                "email": "jane@example.com",
+                "case_type": CaseType.AUTO_ACCIDENT,
+                "case_status": CaseStatus.QUALIFIED,
+                "preferred_contact_method": ContactMethod.SMS,
+            }
+        )
+        by_column = dict(zip(PLAINTIFF_COPY_COLUMNS, record))
+        assert by_column["case_type"] == "AUTO_ACCIDENT"
+        assert by_column["case_status"] == "QUALIFIED"
+        assert by_column["preferred_contact_method"] == "SMS"
@@ -1,5 +1,7 @@
 """Tests for OpenAI client service."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch, Mock
 
@@ -152,4 +154,55 @@ class TestOpenAIClient:
         client.reset_token_usage()
         
         usage = client.get_token_usage()
-        assert usage["total_tokens"] == 0
\ No newline at end of file
+        assert usage["total_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_analyze_case_full_cache_varies_by_recipient(self, client):
+        """Test cached bundles are not shared across recipients."""
+        bundle = json.dumps({
+            "analysis": {
+                "classification": "medical",
+                "entities": [],
+                "summary": "Summary",
+                "confidence_score": 90,
+                "legal_terms": [],
+                "medical_terms": [],
+            },
+            "risk": {
+                "overall_score": 50,
+                "financial_risk": 50,
+                "legal_risk": 50,
+                "medical_risk": 50,
+                "behavioral_risk": 50,
+                "risk_factors": [],
+                "red_flags": [],
+                "recommendations": [],
+                "confidence": 80,
+            },
+            "communication": {"subject": "Your case", "content": "Dear Client"},
+        })
+        case_data = {"case_type": "personal_injury"}
+        # The fixture's settings mock leaves these as MagicMocks
+        client.default_model = "gpt-3.5-turbo"
+        client._cache_ttl = 60
+
+        with patch.object(
+            client, "chat_completion", new=AsyncMock(return_value=bundle)
+        ) as mock_chat:
+            await client.analyze_case_full(
+                "Sample text", case_data,
+                {"recipient_name": "Alice", "company_name": "Acme Legal"},
+            )
+            # Different recipient, same case: must miss the cache
+            await client.analyze_case_full(
+                "Sample text", case_data,
+                {"recipient_name": "Bob", "company_name": "Acme Legal"},
+            )
+            assert mock_chat.await_count == 2
+            
+            # Same recipient again: served from cache
+            await client.analyze_case_full(
+                "Sample text", case_data,
+                {"recipient_name": "Alice", "company_name": "Acme Legal"},
+            )
+            assert mock_chat.await_count == 2
@@ -0,0 +1,22 @@
+"""Tests for the Plaintiff database model."""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.models.database.plaintiff import Plaintiff
+
+
+class TestPlaintiffFullName:
+    """Tests for the server-side full_name column property."""
+
+    def test_full_name_includes_middle_name(self):
+        """The SQL expression must agree with PlaintiffResponse.full_name,
+        which joins first/middle/last and skips a missing middle name."""
+        sql = str(
+            select(Plaintiff.full_name).compile(dialect=postgresql.dialect())
+        )
+        assert "first_name" in sql
+        assert "last_name" in sql
+        # middle_name folded in via coalesce so NULL contributes nothing
+        assert "coalesce" in sql
+        assert "middle_name" in sql
@@ -0,0 +1,182 @@
+"""Tests for plaintiff API routes."""
+
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.api.routes.plaintiffs import get_plaintiff_stats, list_plaintiffs
+from src.models.schemas.common import decode_cursor
+
+
+def _request_with_permissions(*permissions):
+    """Build a request mock that passes require_permissions."""
+    request = Mock()
+    request.state.permissions = list(permissions)
+    return request
+
+
+def _stats_row(
+    grouping_id,
+    case_status=None,
+    case_type=None,
+    state=None,
+    row_count=0,
+    avg_risk_score=None,
+    high_risk_count=0,
+    qualified_count=0,
+):
+    """Fake row from the GROUPING SETS stats query."""
+    return SimpleNamespace(
+        grouping_id=grouping_id,
+        case_status=case_status,
+        case_type=case_type,
+        state=state,
+        row_count=row_count,
+        avg_risk_score=avg_risk_score,
+        high_risk_count=high_risk_count,
+        qualified_count=qualified_count,
+    )
+
+
+class TestGetPlaintiffStats:
+    """Tests for the dashboard stats endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_null_state_row_does_not_clobber_totals(self):
+        """A NULL-state bucket row must not overwrite the grand total."""
+        rows = [
+            # Grand total first ...
+            _stats_row(
+                0b111,
+                row_count=3,
+                avg_risk_score=0.4,
+                high_risk_count=1,
+                qualified_count=2,
+            ),
+            # ... then the NULL-state bucket from the (state) set, which
+            # has the same all-NULL key columns as the grand total.
+            _stats_row(0b110, row_count=1),
+            _stats_row(0b011, case_status="INITIAL", row_count=3),
+            _stats_row(0b101, case_type="AUTO_ACCIDENT", row_count=3),
+            _stats_row(0b110, state="CA", row_count=2),
+        ]
+        session = Mock()
+        session.execute = AsyncMock(return_value=rows)
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        with patch(
+            "src.api.routes.plaintiffs.get_database_session", fake_session
+        ):
+            response = await get_plaintiff_stats(
+                _request_with_permissions("read:plaintiffs")
+            )
+
+        payload = json.loads(response.body)
+        assert payload["total_count"] == 3
+        assert payload["average_risk_score"] == 0.4
+        assert payload["high_risk_count"] == 1
+        assert payload["qualified_count"] == 2
+        assert payload["by_status"] == {"initial": 3}
+        assert payload["by_case_type"] == {"auto_accident": 3}
+        # The NULL-state bucket is dropped, not emitted under a None key
+        assert payload["by_state"] == {"CA": 2}
+
+
+def _fake_plaintiff(created_at):
+    """ORM-shaped stand-in with the fields the list view reads."""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        full_name="Jane Doe",
+        first_name="Jane",
+        last_name="Doe",
+        email="jane@example.com",
+        phone=None,
+        full_address="",
+        case_type=SimpleNamespace(value="auto_accident"),
+        case_status=SimpleNamespace(value="initial"),
+        case_description=None,
+        incident_date=None,
+        law_firm=None,
+        employment_status=None,
+        monthly_income=None,
+        risk_score=None,
+        preferred_contact_method=SimpleNamespace(value="email"),
+        lead_source=None,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+class TestListPlaintiffs:
+    """Tests for the paginated list endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_offset_page_issues_next_cursor(self):
+        """Page-based responses must hand out a cursor when more rows exist."""
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        # limit + 1 rows back from the database: another page exists
+        rows = [_fake_plaintiff(base - timedelta(minutes=i)) for i in range(3)]
+
+        count_result = Mock()
+        count_result.scalar.return_value = 10
+        list_result = Mock()
+        list_result.scalars.return_value.all.return_value = rows
+        session = Mock()
+        session.execute = AsyncMock(side_effect=[count_result, list_result])
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        with patch(
+            "src.api.routes.plaintiffs.get_database_session", fake_session
+        ):
+            response = await list_plaintiffs(
+                _request_with_permissions("read:plaintiffs"), page=1, limit=2
+            )
+
+        payload = json.loads(response.body)
+        assert len(payload["plaintiffs"]) == 2
+        assert payload["total"] == 10
+        assert payload["page"] == 1
+        # The cursor points at the last row actually returned
+        assert payload["next_cursor"] is not None
+        cursor_ts, cursor_id = decode_cursor(payload["next_cursor"])
+        assert cursor_ts == rows[1].created_at
+        assert cursor_id == rows[1].id
+
+    @pytest.mark.asyncio
+    async def test_offset_last_page_has_no_cursor(self):
+        """No extra row fetched means no next_cursor."""
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        rows = [_fake_plaintiff(base)]
+
+        count_result = Mock()
+        count_result.scalar.return_value = 1
+        list_result = Mock()
+        list_result.scalars.return_value.all.return_value = rows
+        session = Mock()
+        session.execute = AsyncMock(side_effect=[count_result, list_result])
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        with patch(
+            "src.api.routes.plaintiffs.get_database_session", fake_session
+        ):
+            response = await list_plaintiffs(
+                _request_with_permissions("read:plaintiffs"), page=1, limit=2
+            )
+
+        payload = json.loads(response.body)
+        assert len(payload["plaintiffs"]) == 1
+        assert payload["next_cursor"] is None